@@ -0,0 +1,5 @@
+"""Stand-alone analysis scripts.
+
+Run them as modules from the repository root, e.g.
+``python -m analysis.compare_supply_demand``.
+"""
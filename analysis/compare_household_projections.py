@@ -12,14 +12,50 @@ assurance by passing the ``--plot`` flag.
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import os
-from glob import glob
+import re
+from glob import glob, has_magic
 from typing import List
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from paths import get_data_path
 
+# Rows per ``read_csv`` chunk; bounds peak memory for large projection files
+CHUNK_SIZE = 200_000
+PROJECTION_DTYPES = {
+    "District": "category",
+    "Year": "int32",
+    "Urban_Households": "float64",
+    "Rural_Households": "float64",
+}
+
+
+def _match_files(pattern: str) -> List[str]:
+    """Return files matching ``pattern`` with a single directory scan.
+
+    Only the file name may contain wildcards; patterns with wildcards in
+    the directory part fall back to :func:`glob.glob`.
+    """
+    directory, name_pattern = os.path.split(pattern)
+    if has_magic(directory):
+        return glob(pattern)
+    regex = re.compile(fnmatch.translate(name_pattern))
+    try:
+        entries = list(os.scandir(directory or os.curdir))
+    except FileNotFoundError:
+        return []
+    return [
+        os.path.join(directory, entry.name)
+        for entry in entries
+        if regex.match(entry.name)
+        and not entry.name.startswith(".")
+        and entry.is_file()
+    ]
+
 
 def load_projection_files(pattern: str) -> pd.DataFrame:
     """Load and combine household projection CSV files.
@@ -35,24 +71,51 @@ def load_projection_files(pattern: str) -> pd.DataFrame:
         DataFrame with columns ``District``, ``Year``, ``SourceFile``,
         ``Urban_Households`` and ``Rural_Households``.
     """
-    files: List[str] = sorted(glob(pattern))
+    files: List[str] = sorted(_match_files(pattern))
     if not files:
         raise FileNotFoundError(f"No files matched pattern: {pattern}")
 
+    # One category per source file so SourceFile is stored as small codes
+    source_dtype = pd.CategoricalDtype(
+        list(dict.fromkeys(os.path.basename(path) for path in files))
+    )
     frames: List[pd.DataFrame] = []
     required_cols = ["District", "Year", "Urban_Households", "Rural_Households"]
     for path in files:
-        df = pd.read_csv(path)
-        missing = set(required_cols) - set(df.columns)
-        if missing:
-            raise ValueError(f"{path} missing columns: {', '.join(sorted(missing))}")
-
-        df = df[required_cols].copy()
-        df["SourceFile"] = os.path.basename(path)
-        frames.append(df)
-
-    combined = pd.concat(frames, ignore_index=True)
-    return combined[["District", "Year", "SourceFile", "Urban_Households", "Rural_Households"]]
+        source_code = source_dtype.categories.get_loc(os.path.basename(path))
+        try:
+            chunks = pd.read_csv(
+                path,
+                usecols=required_cols,
+                dtype=PROJECTION_DTYPES,
+                chunksize=CHUNK_SIZE,
+            )
+            for chunk in chunks:
+                chunk["SourceFile"] = pd.Categorical.from_codes(
+                    np.full(len(chunk), source_code), dtype=source_dtype
+                )
+                frames.append(chunk)
+        except ValueError as exc:
+            header = pd.read_csv(path, nrows=0).columns
+            missing = set(required_cols) - set(header)
+            if not missing:
+                raise
+            raise ValueError(
+                f"{path} missing columns: {', '.join(sorted(missing))}"
+            ) from exc
+
+    # Each chunk infers its own District categories; give every chunk the
+    # same sorted union so the concatenated column stays categorical
+    districts = union_categoricals(
+        [frame["District"] for frame in frames]
+    ).categories.sort_values()
+    for frame in frames:
+        frame["District"] = frame["District"].cat.set_categories(districts)
+    combined = pd.concat(frames, ignore_index=True, copy=False)
+    return combined.reindex(
+        columns=["District", "Year", "SourceFile", "Urban_Households", "Rural_Households"],
+        copy=False,
+    )
 
 
 def plot_differences(df: pd.DataFrame, out_path: str) -> None:
@@ -65,17 +128,29 @@ def plot_differences(df: pd.DataFrame, out_path: str) -> None:
         print("Not enough source files to plot differences.")
         return
 
-    import matplotlib.pyplot as plt  # Imported here to avoid hard dependency
+    # Imported here to avoid a hard dependency; the non-interactive Agg
+    # backend skips GUI backend detection in headless runs.
+    import matplotlib
 
-    index = ["District", "Year"]
-    pivot_urban = df.pivot_table(index=index, columns="SourceFile", values="Urban_Households")
-    pivot_rural = df.pivot_table(index=index, columns="SourceFile", values="Rural_Households")
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
-    diff_urban = pivot_urban.max(axis=1) - pivot_urban.min(axis=1)
-    diff_rural = pivot_rural.max(axis=1) - pivot_rural.min(axis=1)
+    value_cols = ["Urban_Households", "Rural_Households"]
+    grouped = df.groupby(["District", "Year"], observed=True)[value_cols]
+    spread = grouped.max() - grouped.min()
 
-    diff_urban_district = diff_urban.groupby(level=0).max().sort_values(ascending=False)
-    diff_rural_district = diff_rural.groupby(level=0).max().sort_values(ascending=False)
+    diff_urban_district = (
+        spread["Urban_Households"]
+        .groupby(level=0, observed=True)
+        .max()
+        .sort_values(ascending=False)
+    )
+    diff_rural_district = (
+        spread["Rural_Households"]
+        .groupby(level=0, observed=True)
+        .max()
+        .sort_values(ascending=False)
+    )
 
     fig, axes = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
 
@@ -89,7 +164,8 @@ def plot_differences(df: pd.DataFrame, out_path: str) -> None:
     axes[1].set_xlabel("District")
 
     fig.tight_layout()
-    plt.savefig(out_path)
+    fig.savefig(out_path)
+    plt.close(fig)
 
 
 def main(plot: bool = False) -> None:
@@ -2,39 +2,44 @@ import argparse
 import os
 import json
 from datetime import datetime
-import sys
-from pathlib import Path
+from functools import lru_cache
 
 import pandas as pd
 
-# Ensure project root is on the Python path when running as a script
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from demand import get_demand
-from demand.demographics import demand_by_region_year
-from paths import get_data_path
+from paths import get_data_path, read_csv_cached
 
 TARGET_MULTIPLIERS = {2030: 0.58, 2040: 0.20, 2050: 0.05}
 BASE_DEMAND_YEAR = 2023
 
 
+@lru_cache(maxsize=None)
 def load_supply():
-    """Load available biomass supply per district in GJ."""
-    supply_df = pd.read_csv(
+    """Load available biomass supply per district in GJ.
+
+    The result is cached per process and must not be modified in place.
+    """
+    supply_df = read_csv_cached(
         get_data_path("regional_supply_full_corrected.csv")
     )
-    supply = supply_df.groupby("District")["Available_GJ"].sum()
+    supply_df["District"] = supply_df["District"].astype("category")
+    supply = supply_df.groupby("District", observed=True)["Available_GJ"].sum()
     supply.name = "supply_gj"
     return supply
 
 
+@lru_cache(maxsize=None)
 def compute_scaled_demand(target_year: int) -> pd.Series:
-    """Return scaled demand for ``target_year`` based on 2023 demand."""
+    """Return scaled demand for ``target_year`` based on 2023 demand.
+
+    The result is cached per target year and must not be modified in place.
+    """
     base_year = BASE_DEMAND_YEAR
     demand = get_demand(base_year)
     if not demand:
+        # Imported here so loading this module does not build the tables
+        from demand.demographics import demand_by_region_year
+
         base_year = min(demand_by_region_year)
         demand = get_demand(base_year)
     base_demand = pd.Series(demand, name=f"demand_{base_year}")
@@ -49,9 +54,18 @@ def compute_scaled_demand(target_year: int) -> pd.Series:
 def compare_supply_demand(target_year: int) -> pd.DataFrame:
     supply = load_supply()
     demand = compute_scaled_demand(target_year)
-    df = pd.concat([supply, demand], axis=1)
-    df["surplus_deficit_gj"] = df["supply_gj"] - df[demand.name]
-    return df
+    # Align both series on one union index, then work on the raw arrays
+    index = pd.Index(supply.index, dtype=object).union(demand.index)
+    supply_gj = supply.reindex(index).to_numpy()
+    demand_gj = demand.reindex(index).to_numpy()
+    return pd.DataFrame(
+        {
+            "supply_gj": supply_gj,
+            demand.name: demand_gj,
+            "surplus_deficit_gj": supply_gj - demand_gj,
+        },
+        index=index,
+    )
 
 
 def main():
@@ -2,12 +2,14 @@
 
 Configuration defaults are stored in ``config/scenarios.yaml``.
 ``load_config`` returns the parsed dictionary and can handle YAML or JSON
-files.
+files. The default configuration is exposed as ``CONFIG`` and parsed on
+first access.
 """
 from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 try:
@@ -42,11 +44,21 @@ def load_config(path: str | None = None) -> Dict[str, Any]:
                 raise RuntimeError(
                     "PyYAML is required to read YAML configuration files."
                 )
-            return yaml.safe_load(fh)
+            # Prefer the libyaml C loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            return yaml.load(fh, Loader=loader)
         if cfg_path.endswith('.json'):
             return json.load(fh)
         raise ValueError(f"Unsupported config format: {cfg_path}")
 
 
-# Eagerly load default configuration for convenience
-CONFIG = load_config()
+@lru_cache(maxsize=1)
+def _load_default_config() -> Dict[str, Any]:
+    return load_config(DEFAULT_CONFIG_PATH)
+
+
+def __getattr__(name: str) -> Any:
+    # Lazily load the default configuration (PEP 562)
+    if name == "CONFIG":
+        return _load_default_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
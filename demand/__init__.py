@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+from . import demographics as _demographics
 from .demographics import (
     URBAN_DEMAND_GJ_PER_HH,
     RURAL_DEMAND_GJ_PER_HH,
     load_demographics,
-    demographics,
-    regions,
+    compute_regional_table,
     compute_demand_by_region_year,
     compute_urban_rural_hh_by_region_year,
-    demand_by_region_year,
-    urban_hh_by_region_year,
-    rural_hh_by_region_year,
 )
 
+# Data-backed tables are forwarded lazily from :mod:`demand.demographics`
+_LAZY_ATTRS = frozenset(
+    {
+        "regions",
+        "regional_table",
+        "demand_by_region_year",
+        "urban_hh_by_region_year",
+        "rural_hh_by_region_year",
+    }
+)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        return getattr(_demographics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_demand(year: int) -> dict[str, float]:
     """Return regional demand (GJ) for ``year``.
@@ -30,15 +44,16 @@ def get_demand(year: int) -> dict[str, float]:
         Mapping of region names to cooking energy demand in gigajoules.
     """
 
-    return demand_by_region_year.get(year, {})
+    return _demographics.demand_by_region_year.get(year, {})
 
 
 __all__ = [
     "URBAN_DEMAND_GJ_PER_HH",
     "RURAL_DEMAND_GJ_PER_HH",
     "load_demographics",
-    "demographics",
     "regions",
+    "regional_table",
+    "compute_regional_table",
     "compute_demand_by_region_year",
     "compute_urban_rural_hh_by_region_year",
     "demand_by_region_year",
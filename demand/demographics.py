@@ -11,7 +11,7 @@ from __future__ import annotations
 from functools import lru_cache
 import pandas as pd
 
-from paths import get_data_path
+from paths import get_data_path, read_csv_cached
 
 
 # Assumed cooking energy demand per household in GJ/year (source: IEA
@@ -19,6 +19,9 @@ from paths import get_data_path
 URBAN_DEMAND_GJ_PER_HH = 6.5  # IEA (2024), page 5
 RURAL_DEMAND_GJ_PER_HH = 5.5  # IEA (2024), page 5
 
+# Only these columns of the projection CSV are used anywhere in the model
+_PROJECTION_COLUMNS = ("District", "Year", "Urban_Households", "Rural_Households")
+
 
 @lru_cache()
 def load_demographics() -> pd.DataFrame:
@@ -33,7 +36,7 @@ def load_demographics() -> pd.DataFrame:
 
     path = get_data_path("District-level_Household_Projections.csv")
     try:
-        df = pd.read_csv(path)
+        df = read_csv_cached(path, usecols=_PROJECTION_COLUMNS)
     except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"Demographic projection file not found: {path}"
@@ -43,12 +46,38 @@ def load_demographics() -> pd.DataFrame:
     return df
 
 
-# Load once for module-level calculations but keep loader for reuse
-demographics = load_demographics()
+def compute_regional_table(df: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Return demand and household counts as one frame.
 
+    This is the canonical columnar form of the regional tables; the
+    nested-dict views (:data:`demand_by_region_year` etc.) are kept for
+    existing callers.
 
-# Extract regions (districts)
-regions = sorted(demographics.index.get_level_values("District").unique())
+    Parameters
+    ----------
+    df : pandas.DataFrame, optional
+        Alternative demographic data frame, as for
+        :func:`compute_demand_by_region_year`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Indexed by ``District`` and ``Year`` with columns ``demand_GJ``,
+        ``urban_hh`` and ``rural_hh``.
+    """
+
+    df = df if df is not None else _resolve("demographics")
+    urban = df["Urban_Households"].to_numpy()
+    rural = df["Rural_Households"].to_numpy()
+    return pd.DataFrame(
+        {
+            "demand_GJ": urban * URBAN_DEMAND_GJ_PER_HH
+            + rural * RURAL_DEMAND_GJ_PER_HH,
+            "urban_hh": urban,
+            "rural_hh": rural,
+        },
+        index=df.index,
+    )
 
 
 def compute_demand_by_region_year(df: pd.DataFrame | None = None):
@@ -68,7 +97,7 @@ def compute_demand_by_region_year(df: pd.DataFrame | None = None):
         Nested mapping ``{year: {district: demand_GJ}}``.
     """
 
-    df = df if df is not None else demographics
+    df = df if df is not None else _resolve("demographics")
     required_cols = {"Urban_Households", "Rural_Households"}
     missing = required_cols - set(df.columns)
     if missing:
@@ -76,35 +105,75 @@ def compute_demand_by_region_year(df: pd.DataFrame | None = None):
             f"Missing required columns: {', '.join(sorted(missing))}"
         )
 
-    demand: dict[int, dict[str, float]] = {}
-    for (district, year), row in df.iterrows():
-        if year not in demand:
-            demand[year] = {}
-        urban_demand = row["Urban_Households"] * URBAN_DEMAND_GJ_PER_HH
-        rural_demand = row["Rural_Households"] * RURAL_DEMAND_GJ_PER_HH
-        total_demand = urban_demand + rural_demand
-        demand[year][district] = total_demand
-    return demand
+    totals = (
+        df["Urban_Households"].to_numpy() * URBAN_DEMAND_GJ_PER_HH
+        + df["Rural_Households"].to_numpy() * RURAL_DEMAND_GJ_PER_HH
+    )
+    return _nest_by_year(pd.Series(totals, index=df.index))
 
 
 def compute_urban_rural_hh_by_region_year(df: pd.DataFrame | None = None):
     """Return household counts split by urban/rural for each region/year."""
 
-    df = df if df is not None else demographics
-    urban: dict[int, dict[str, float]] = {}
-    rural: dict[int, dict[str, float]] = {}
-    for (district, year), row in df.iterrows():
-        if year not in urban:
-            urban[year] = {}
-            rural[year] = {}
-        urban[year][district] = row["Urban_Households"]
-        rural[year][district] = row["Rural_Households"]
+    df = df if df is not None else _resolve("demographics")
+    urban = _nest_by_year(df["Urban_Households"])
+    rural = _nest_by_year(df["Rural_Households"])
     return urban, rural
 
 
-# Precompute values for use in optimisation and adoption models
-demand_by_region_year = compute_demand_by_region_year()
-urban_hh_by_region_year, rural_hh_by_region_year = compute_urban_rural_hh_by_region_year()
+def _nest_by_year(values: pd.Series) -> dict[int, dict[str, float]]:
+    """Convert a ``(District, Year)``-indexed series to ``{year: {district: value}}``."""
+
+    return {
+        year: group.droplevel("Year").to_dict()
+        for year, group in values.groupby(level="Year", sort=False)
+    }
+
+
+# Module-level tables are built on first access (PEP 562) so that importing
+# the package does not read the projection CSV.
+def _build_regions() -> list[str]:
+    df = _resolve("demographics")
+    return sorted(df.index.get_level_values("District").unique())
+
+
+def _build_urban_hh() -> dict[int, dict[str, float]]:
+    return compute_urban_rural_hh_by_region_year()[0]
+
+
+def _build_rural_hh() -> dict[int, dict[str, float]]:
+    return compute_urban_rural_hh_by_region_year()[1]
+
+
+_LAZY_ATTRS = {
+    "demographics": load_demographics,
+    "regional_table": compute_regional_table,
+    "regions": _build_regions,
+    "demand_by_region_year": compute_demand_by_region_year,
+    "urban_hh_by_region_year": _build_urban_hh,
+    "rural_hh_by_region_year": _build_rural_hh,
+}
+
+
+def __getattr__(name: str):
+    try:
+        builder = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = builder()
+    globals()[name] = value
+    return value
+
+
+def _resolve(name: str):
+    """Return a lazy attribute, honouring values assigned on the module."""
+
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
 
 
 __all__ = [
@@ -112,7 +181,9 @@ __all__ = [
     "RURAL_DEMAND_GJ_PER_HH",
     "load_demographics",
     "demographics",
+    "regional_table",
     "regions",
+    "compute_regional_table",
     "compute_demand_by_region_year",
     "compute_urban_rural_hh_by_region_year",
     "demand_by_region_year",
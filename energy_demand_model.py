@@ -3,11 +3,16 @@ bioenergy project."""
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from numbers import Real
 
 import os
 import json
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+import numpy as np
 import pandas as pd
 
 try:
@@ -31,54 +36,93 @@ else:
 from data_input import get_parameters
 
 
-def project_energy_demand(
-    total_pop: float, cooking_demand_per_capita: float
-) -> float:
+class DemandTable(Mapping):
+    """Year-by-region values stored as a 2-D ``float64`` array.
+
+    ``table[year, region]`` returns a single value, while ``table[year]``
+    returns a ``{region: value}`` dict so the table can stand in for the
+    nested ``{year: {region: value}}`` mappings used elsewhere.
+    """
+
+    def __init__(
+        self, years: Iterable[int], regions: Iterable[str], data: np.ndarray
+    ) -> None:
+        self.years = tuple(years)
+        self.regions = tuple(regions)
+        self.data = np.asarray(data, dtype=np.float64)
+        if self.data.shape != (len(self.years), len(self.regions)):
+            raise ValueError("data shape does not match years and regions")
+        self._year_idx = {yr: i for i, yr in enumerate(self.years)}
+        self._region_idx = {reg: j for j, reg in enumerate(self.regions)}
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            year, region = key
+            return self.data[self._year_idx[year], self._region_idx[region]]
+        row = self.data[self._year_idx[key]]
+        return dict(zip(self.regions, row.tolist()))
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.years)
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+
+def _non_negative(value, name: str):
+    """Validate ``value`` as a non-negative scalar or array of numbers.
+
+    Python/NumPy scalars are checked directly; sequences and arrays are
+    converted to a ``float64`` :class:`numpy.ndarray` and checked in one
+    vectorised comparison.
+    """
+
+    if isinstance(value, Real):
+        if value < 0:
+            raise ValueError(f"{name} must be a non-negative number")
+        return value
+    if isinstance(value, (np.ndarray, pd.Series, list, tuple)):
+        arr = np.asarray(value, dtype=np.float64)
+        if (arr < 0).any():
+            raise ValueError(f"{name} must be non-negative")
+        return arr
+    raise ValueError(f"{name} must be a non-negative number")
+
+
+def project_energy_demand(total_pop, cooking_demand_per_capita):
     """Return total annual cooking energy demand.
 
     Parameters
     ----------
-    total_pop : float
-        Total population in the year of interest.
-    cooking_demand_per_capita : float
+    total_pop : float or array_like
+        Total population in the year of interest. Arrays are projected
+        element-wise.
+    cooking_demand_per_capita : float or array_like
         Annual cooking energy demand per capita (GJ per person per year).
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         Total annual cooking energy demand in gigajoules (GJ).
     """
 
-    if not isinstance(total_pop, Real) or total_pop < 0:
-        raise ValueError("total_pop must be a non-negative number")
-    if (
-        not isinstance(cooking_demand_per_capita, Real)
-        or cooking_demand_per_capita < 0
-    ):
-        raise ValueError(
-            "cooking_demand_per_capita must be a non-negative number"
-        )
+    total_pop = _non_negative(total_pop, "total_pop")
+    cooking_demand_per_capita = _non_negative(
+        cooking_demand_per_capita, "cooking_demand_per_capita"
+    )
     return total_pop * cooking_demand_per_capita
 
 
-def project_household_energy_demand(urban_hh: float, rural_hh: float) -> float:
+def project_household_energy_demand(urban_hh, rural_hh):
     """Return total annual cooking energy demand given household counts.
 
     Multiplies the number of urban and rural households by their respective
-    per‑household demand constants defined in :mod:`demand`.
+    per‑household demand constants defined in :mod:`demand`. Scalars or
+    equally shaped arrays are accepted.
     """
 
-    if not isinstance(urban_hh, Real) or urban_hh < 0:
-        raise ValueError("urban_hh must be a non-negative number")
-    if not isinstance(rural_hh, Real) or rural_hh < 0:
-        raise ValueError("rural_hh must be a non-negative number")
-
-
-    return (
-        urban_hh * URBAN_DEMAND_GJ_PER_HH
-        + rural_hh * RURAL_DEMAND_GJ_PER_HH
-    )
-
+    urban_hh = _non_negative(urban_hh, "urban_hh")
+    rural_hh = _non_negative(rural_hh, "rural_hh")
     return urban_hh * URBAN_DEMAND_GJ_PER_HH + rural_hh * RURAL_DEMAND_GJ_PER_HH
 
 # -------------------------------------------------------
@@ -142,9 +186,7 @@ def disaggregate_to_hourly(
             profile = profile.resample(freq).sum()
     except Exception:
         # Fall back to a uniform profile if ERA5 data are unavailable
-        periods = int(pd.Timedelta("365D") / pd.Timedelta(freq))
-        index = pd.date_range("2000-01-01", periods=periods, freq=freq)
-        profile = pd.Series(1.0, index=index)
+        profile = pd.Series(1.0, index=uniform_year_index(freq))
 
     total = profile.sum()
     if total == 0:
@@ -153,6 +195,18 @@ def disaggregate_to_hourly(
     return weights * annual_gj
 
 
+@lru_cache(maxsize=None)
+def uniform_year_index(freq: str) -> pd.DatetimeIndex:
+    """Return the ``freq``-spaced index of a 365-day year used without ERA5.
+
+    Parsing the frequency strings is comparatively slow, so the index is
+    built once per frequency and shared by all callers.
+    """
+
+    periods = int(pd.Timedelta("365D") / pd.Timedelta(freq))
+    return pd.date_range("2000-01-01", periods=periods, freq=freq)
+
+
 # Parameters and Precomputed Demand Table
 
 params = get_parameters()
@@ -166,14 +220,23 @@ def export_demand_table(years: list[int]) -> pd.DataFrame:
     data. The function returns the demand table for further processing.
     """
 
-    rows = []
+    region_col: list[str] = []
+    year_col: list[int] = []
+    demand_parts: list[np.ndarray] = []
     for yr in years:
         region_pops = population_by_year_and_region.get(yr, {})
-        for reg, pop in region_pops.items():
-            demand = project_energy_demand(pop, per_capita_demand)
-            rows.append({"region": reg, "year": yr, "demand_GJ": demand})
-
-    df = pd.DataFrame(rows)
+        pops = np.fromiter(region_pops.values(), dtype=np.float64)
+        region_col.extend(region_pops)
+        year_col.extend([yr] * len(pops))
+        demand_parts.append(project_energy_demand(pops, per_capita_demand))
+
+    df = pd.DataFrame(
+        {
+            "region": region_col,
+            "year": year_col,
+            "demand_GJ": np.concatenate(demand_parts) if demand_parts else [],
+        }
+    )
     out_dir = os.path.join("results", "demand")
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, "demand.csv")
@@ -200,17 +263,24 @@ def project_population(
     base_population: int,
     annual_growth_rate: float,
 ) -> float:
-    """Compound population projection using exponential growth."""
+    """Compound population projection using exponential growth.
 
-    if target_year < base_year:
+    ``target_year`` may also be an array of years, in which case an array
+    of projections is returned.
+    """
+
+    if np.any(np.asarray(target_year) < base_year):
         raise ValueError(
             "target_year must be greater than or equal to base_year"
         )
     if annual_growth_rate < 0:
         raise ValueError("annual_growth_rate must be non-negative")
 
-    years = target_year - base_year
-    return base_population * ((1 + annual_growth_rate) ** years)
+    if isinstance(target_year, Real):
+        years = target_year - base_year
+        return base_population * ((1 + annual_growth_rate) ** years)
+    years = np.asarray(target_year, dtype=np.float64) - base_year
+    return base_population * np.power(1 + annual_growth_rate, years)
 
 
 # Base assumptions (defaults enable importing without full parameter set)
@@ -225,32 +295,44 @@ hh_size_rural = params.get("household_size_rural", 1)
 years = [2030, 2040, 2050]
 n_regions = len(regions) if regions else 1
 
-# Project total population for each model year
-total_population_by_year = {
-    yr: project_population(base_year, yr, base_population, growth_rate)
-    for yr in years
-}
+# Project total population for each model year; the growth factor depends
+# only on the year, so all years are projected in one array operation
+_total_population = project_population(
+    base_year, years, base_population, growth_rate
+)
+total_population_by_year = dict(zip(years, _total_population.tolist()))
+
+
+def _household_matrix(
+    table: dict[int, dict[str, float]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(values, present)`` arrays of shape ``(years, regions)``."""
+
+    values = np.zeros((len(years), len(regions)))
+    present = np.zeros((len(years), len(regions)), dtype=bool)
+    for i, yr in enumerate(years):
+        row = table.get(yr, {})
+        for j, reg in enumerate(regions):
+            value = row.get(reg)
+            if value is not None:
+                values[i, j] = value
+                present[i, j] = True
+    return values, present
+
 
 # Derive regional populations, falling back to a uniform split
-population_by_year_and_region: dict[int, dict[str, float]] = {}
-for yr in years:
-    pops_for_year: dict[str, float] = {}
-    for reg in regions:
-        urban_hh = urban_hh_by_region_year.get(yr, {}).get(reg)
-        rural_hh = rural_hh_by_region_year.get(yr, {}).get(reg)
-        if urban_hh is not None and rural_hh is not None:
-            pops_for_year[reg] = (
-                urban_hh * hh_size_urban + rural_hh * hh_size_rural
-            )
-        else:
-            pops_for_year[reg] = total_population_by_year[yr] / n_regions
-    population_by_year_and_region[yr] = pops_for_year
+_urban_hh, _has_urban = _household_matrix(urban_hh_by_region_year)
+_rural_hh, _has_rural = _household_matrix(rural_hh_by_region_year)
+_population = np.where(
+    _has_urban & _has_rural,
+    _urban_hh * hh_size_urban + _rural_hh * hh_size_rural,
+    (_total_population / n_regions)[:, None],
+)
+population_by_year_and_region = DemandTable(years, regions, _population)
 
 # Total cooking energy demand by year and region (GJ)
-total_cooking_demand_GJ_by_year_and_region: dict[int, dict[str, float]] = {
-    yr: {
-        reg: project_energy_demand(pop, per_capita_demand)
-        for reg, pop in region_pops.items()
-    }
-    for yr, region_pops in population_by_year_and_region.items()
-}
+if per_capita_demand < 0:
+    raise ValueError("cooking_demand_per_capita must be a non-negative number")
+total_cooking_demand_GJ_by_year_and_region = DemandTable(
+    years, regions, _population * per_capita_demand
+)
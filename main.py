@@ -23,11 +23,20 @@ from __future__ import annotations
 import argparse
 import os
 
-import modelling_stock_flow as msf
-import modelling_cost as mc
 from config import load_config
 
 
+def _non_negative_int(value: str) -> int:
+    """Parse ``value`` as an integer that is zero or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Run the CI bioenergy modelling pipelines.",
@@ -75,7 +84,7 @@ def main() -> None:
     )
     parser.add_argument(
         "--solver",
-        choices=["cbc", "glpk", "gurobi"],
+        choices=["highs", "cbc", "glpk", "gurobi"],
         default=None,
         help="Select optimisation solver when using --optimise. Defaults to config.",
     )
@@ -91,11 +100,18 @@ def main() -> None:
         default=None,
         help="Override maximum traditional firewood share (fraction).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_non_negative_int,
+        default=1,
+        help="Worker processes for scenario runs; 0 uses all CPUs "
+        "(os.cpu_count()).",
+    )
     args = parser.parse_args()
     cfg = load_config(args.config)
     scenarios = args.scenarios or cfg.get("scenarios", [])
     years = args.years or cfg.get("years", [])
-    solver = args.solver or cfg.get("solver", "cbc")
+    solver = args.solver or cfg.get("solver", "highs")
     constraints = cfg.get("constraints", {})
     min_clean_share = args.min_clean_share
     if min_clean_share is None:
@@ -104,9 +120,17 @@ def main() -> None:
     if max_firewood_share is None:
         max_firewood_share = constraints.get("max_firewood_share")
     os.makedirs("results", exist_ok=True)
+    # Pipeline modules are imported on demand so ``--help`` and each
+    # pipeline only pay for the imports they use.
     if args.pipeline == "stockflow":
+        import modelling_stock_flow as msf
+
         msf.run_all_scenarios(
-            scenarios=scenarios, years=years, timeseries=args.timeseries, config=cfg
+            scenarios=scenarios,
+            years=years,
+            timeseries=args.timeseries,
+            config=cfg,
+            n_jobs=args.jobs or None,
         )
         print(
             "✔ Stock‑flow scenarios have been generated and saved to the results directory."
@@ -114,6 +138,8 @@ def main() -> None:
         if args.pypsa_export:
             print("⚠ PyPSA export is currently only supported for the cost pipeline.")
     elif args.pipeline == "cost":
+        import modelling_cost as mc
+
         df_full, _ = mc.run_all_scenarios(
             scenarios=scenarios,
             years=years,
@@ -123,6 +149,7 @@ def main() -> None:
             config=cfg,
             min_clean_share=min_clean_share,
             max_firewood_share=max_firewood_share,
+            n_jobs=args.jobs or None,
         )
         print(
             "✔ Cost analysis scenarios have been generated and saved to the results directory."
@@ -130,7 +157,16 @@ def main() -> None:
         if args.pypsa_export and not df_full.empty:
             from pypsa_export import write_pypsa_generators, write_pypsa_loads
 
-            for (scenario, year), df_subset in df_full.groupby(["Scenario", "Year"]):
+            # Integer-coded keys and no sorting keep per-group overhead low
+            groups = df_full.groupby(
+                [
+                    df_full["Scenario"],
+                    df_full["Year"].astype("int32"),
+                ],
+                sort=False,
+                observed=True,
+            )
+            for (scenario, year), df_subset in groups:
                 tech_costs = mc._load_levelised_costs(scenario, year)
                 out_dir = os.path.join("results", "pypsa", scenario, str(year))
                 write_pypsa_loads(df_subset, out_dir)
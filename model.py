@@ -1,5 +1,8 @@
 # model.py  (v2)
 from __future__ import annotations
+import logging
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
 # Import PuLP lazily to avoid a hard dependency when optimisation is not used.
@@ -10,35 +13,73 @@ except ImportError:
 from typing import Dict
 
 # Expose public API
-__all__ = ["run_cost_fixed_mix", "run_cost_minimise_cost"]
+__all__ = [
+    "CleanCookingLP",
+    "run_cost_fixed_mix",
+    "run_cost_minimise_cost",
+    "resolve_solver",
+]
+
+logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------
 # Helper: common result formatting
 # ------------------------------------------------------------------
+def _to_frame(year: int, region: str, columns: Dict[str, object]) -> pd.DataFrame:
+    return pd.DataFrame({"Year": year, "Region": region, **columns})
+
+
+def _solution_columns(demand_GJ: float,
+                      tech_costs: Dict[str, float],
+                      variables: Dict[str, pulp.LpVariable]) -> tuple[Dict[str, object], float]:
+    techs = list(variables)
+    energy = np.fromiter(
+        (var.varValue for var in variables.values()), dtype=np.float64, count=len(techs)
+    )
+    cost_arr = np.fromiter(
+        (tech_costs[t] for t in techs), dtype=np.float64, count=len(techs)
+    )
+    cost = energy * cost_arr
+    columns = {
+        "Technology": techs,
+        "Share": energy / demand_GJ,
+        "Energy_GJ": energy,
+        "Cost_USD": cost,
+    }
+    return columns, cost.sum()
+
+
 def _format_result(year: int,
                    region: str,
                    demand_GJ: float,
                    tech_costs: Dict[str, float],
                    variables: Dict[str, pulp.LpVariable]) -> tuple[pd.DataFrame, float]:
-    rows = []
-    total_cost = 0.0
-    for tech, var in variables.items():
-        gj = var.varValue
-        cost = gj * tech_costs[tech]
-        total_cost += cost
-        rows.append({
-            "Year": year,
-            "Region": region,
-            "Technology": tech,
-            "Share": gj / demand_GJ,
-            "Energy_GJ": gj,
-            "Cost_USD": cost,
-        })
-    return pd.DataFrame(rows), total_cost
+    columns, total_cost = _solution_columns(demand_GJ, tech_costs, variables)
+    return _to_frame(year, region, columns), total_cost
 
 # ------------------------------------------------------------------
 # 1. Fixed-mix calculator (original intent)
 # ------------------------------------------------------------------
+def _fixed_mix_columns(demand_GJ: float,
+                       shares: Dict[str, float],
+                       tech_costs: Dict[str, float]) -> tuple[Dict[str, object], float]:
+    """Return the result columns and total cost for a fixed mix."""
+    techs = list(shares)
+    share_arr = np.fromiter(shares.values(), dtype=np.float64, count=len(techs))
+    cost_arr = np.fromiter(
+        (tech_costs[t] for t in techs), dtype=np.float64, count=len(techs)
+    )
+    energy = demand_GJ * share_arr
+    cost = energy * cost_arr
+    columns = {
+        "Technology": techs,
+        "Share": share_arr,
+        "Energy_GJ": energy,
+        "Cost_USD": cost,
+    }
+    return columns, cost.sum()
+
+
 def run_cost_fixed_mix(year: int,
                        region: str,
                        demand_GJ: float,
@@ -47,17 +88,8 @@ def run_cost_fixed_mix(year: int,
     """
     Compute system cost for a *given* technology mix (no optimisation).
     """
-    df = pd.DataFrame({
-        "Year": year,
-        "Region": region,
-        "Technology": list(shares.keys()),
-        "Share": list(shares.values()),
-        "Energy_GJ": [demand_GJ * s for s in shares.values()],
-        "Cost_USD": [demand_GJ * s * tech_costs[t]
-                     for t, s in shares.items()],
-    })
-    total_cost = df["Cost_USD"].sum()
-    return df, total_cost
+    columns, total_cost = _fixed_mix_columns(demand_GJ, shares, tech_costs)
+    return _to_frame(year, region, columns), total_cost
 
 # ------------------------------------------------------------------
 # 2. Least-cost optimisation with policy constraints
@@ -68,7 +100,7 @@ def run_cost_minimise_cost(year: int,
                            min_clean_share: float,
                            max_firewood_share: float,
                            tech_costs: Dict[str, float],
-                           solver: str = "cbc") -> tuple[pd.DataFrame, float]:
+                           solver: str = "highs") -> tuple[pd.DataFrame, float]:
     """
     LP that chooses the cheapest technology mix subject to:
       - Σ GJ == demand_GJ
@@ -78,35 +110,42 @@ def run_cost_minimise_cost(year: int,
     Parameters
     ----------
     solver : str, optional
-        Optimisation solver to use (``"cbc"``, ``"glpk"`` or ``"gurobi"``).
+        Optimisation solver to use (``"highs"``, ``"cbc"``, ``"glpk"`` or
+        ``"gurobi"``). HiGHS falls back to CBC when it is not installed.
     """
-    clean_techs = {"biogas", "ethanol", "electricity", "lpg", "improved_biomass"}
-    firewood_techs = {"firewood", "charcoal"}
+    gj_vars = _solve_minimise_cost(
+        year, region, demand_GJ, min_clean_share, max_firewood_share,
+        tech_costs, solver,
+    )
+    return _format_result(year, region, demand_GJ, tech_costs, gj_vars)
 
-    if pulp is None:
-        raise RuntimeError(
-            "PuLP is not installed. The cost minimisation optimisation cannot be performed."
-        )
-    model = pulp.LpProblem(f"CleanCooking_{region}_{year}", pulp.LpMinimize)
 
-    # Decision variables: GJ allocated to each tech
-    techs = list(tech_costs.keys())
-    gj_vars = {t: pulp.LpVariable(f"gj_{t}", lowBound=0) for t in techs}
+def _highs_solver(**kwargs) -> "pulp.LpSolver":
+    """Return HiGHS via its in-process API (``highspy``), else the binary."""
+    solver_cmd = pulp.HiGHS(**kwargs)
+    if solver_cmd.available():
+        return solver_cmd
+    return pulp.HiGHS_CMD(**kwargs)
 
-    # Objective: minimise total cost
-    model += pulp.lpSum([gj_vars[t] * tech_costs[t] for t in techs])
 
-    # Constraint 1: meet demand
-    model += pulp.lpSum([gj_vars[t] for t in techs]) == demand_GJ
+# Solvers substituted when the requested one is not installed
+_SOLVER_FALLBACKS = {"highs": "cbc"}
 
-    # Constraint 2: clean-cooking minimum
-    model += pulp.lpSum([gj_vars[t] for t in clean_techs]) >= min_clean_share * demand_GJ
 
-    # Constraint 3: firewood cap
-    model += pulp.lpSum([gj_vars[t] for t in firewood_techs]) <= max_firewood_share * demand_GJ
+@lru_cache(maxsize=None)
+def _available_solver(solver: str) -> tuple[str, "pulp.LpSolver"]:
+    """Return the name and a quiet PuLP instance of the solver used for ``solver``.
 
-    # Solve
+    Instances are memoised so every LP in a run shares one solver and its
+    availability check (a ``PATH`` lookup or import) runs only once. A
+    fallback from :data:`_SOLVER_FALLBACKS` is logged as a warning.
+    """
+    if pulp is None:
+        raise RuntimeError(
+            "PuLP is not installed. The cost minimisation optimisation cannot be performed."
+        )
     solver_map = {
+        "highs": _highs_solver,
         "cbc": pulp.PULP_CBC_CMD,
         "glpk": pulp.GLPK_CMD,
         "gurobi": pulp.GUROBI_CMD,
@@ -115,9 +154,117 @@ def run_cost_minimise_cost(year: int,
         raise ValueError(f"Unknown solver '{solver}'.")
     solver_cmd = solver_map[solver](msg=0)
     if hasattr(solver_cmd, "available") and not solver_cmd.available():
+        if solver in _SOLVER_FALLBACKS:
+            fallback = _SOLVER_FALLBACKS[solver]
+            logger.warning(
+                "Solver '%s' is not available; falling back to '%s'.",
+                solver, fallback,
+            )
+            return _available_solver(fallback)
         raise RuntimeError(f"Requested solver '{solver}' is not available.")
-    model.solve(solver_cmd)
-    if pulp.LpStatus[model.status] != "Optimal":
+    return solver, solver_cmd
+
+
+def _get_solver(solver: str) -> "pulp.LpSolver":
+    """Return the memoised PuLP solver instance used for ``solver``."""
+    return _available_solver(solver)[1]
+
+
+def resolve_solver(solver: str) -> str:
+    """Return the name of the solver that actually runs for ``solver``.
+
+    This differs from ``solver`` only when it is unavailable and a
+    fallback (e.g. HiGHS to CBC) is used instead.
+    """
+    return _available_solver(solver)[0]
+
+
+def _solve_minimise_cost(year: int,
+                         region: str,
+                         demand_GJ: float,
+                         min_clean_share: float,
+                         max_firewood_share: float,
+                         tech_costs: Dict[str, float],
+                         solver: str) -> Dict[str, "pulp.LpVariable"]:
+    """Build and solve the least-cost LP; return the solved variables."""
+    lp = CleanCookingLP(tech_costs, solver)
+    status = lp.solve(demand_GJ, min_clean_share, max_firewood_share, tech_costs)
+    if status != "Optimal":
         raise RuntimeError(f"No optimal solution for {region} in {year}.")
+    return lp.variables
 
-    return _format_result(year, region, demand_GJ, tech_costs, gj_vars)
+
+class CleanCookingLP:
+    """Least-cost technology LP that is built once and re-solved.
+
+    The variables and constraint structure depend only on the set of
+    technologies, so repeated solves (e.g. per scenario, year and region)
+    only update the objective coefficients and the constraint right-hand
+    sides instead of rebuilding the model.
+
+    Parameters
+    ----------
+    techs : iterable of str
+        Technologies available to the LP.
+    solver : str, optional
+        Optimisation solver to use, see :func:`run_cost_minimise_cost`.
+    """
+
+    CLEAN_TECHS = frozenset({"biogas", "ethanol", "electricity", "lpg", "improved_biomass"})
+    FIREWOOD_TECHS = frozenset({"firewood", "charcoal"})
+
+    def __init__(self, techs, solver: str = "highs") -> None:
+        if pulp is None:
+            raise RuntimeError(
+                "PuLP is not installed. The cost minimisation optimisation cannot be performed."
+            )
+        self.techs = list(techs)
+        self.model = pulp.LpProblem("CleanCooking", pulp.LpMinimize)
+        self._solver = _get_solver(solver)
+
+        # Decision variables: GJ allocated to each tech
+        self.variables = {
+            t: pulp.LpVariable(f"gj_{t}", lowBound=0) for t in self.techs
+        }
+
+        # Expressions are built directly from (variable, coefficient) pairs,
+        # avoiding the intermediate per-term expressions created by lpSum,
+        # and constraints take their sense and right-hand side directly
+        # rather than via the copying ``expr == rhs`` operators.
+        def total(subset, sense, name):
+            expr = pulp.LpAffineExpression(
+                (self.variables[t], 1.0) for t in self.techs if t in subset
+            )
+            constraint = pulp.LpConstraint(expr, sense, name, 0.0)
+            self.model.addConstraint(constraint)
+            return constraint
+
+        # Constraint 1: meet demand
+        self._demand = total(self.variables, pulp.LpConstraintEQ, "demand")
+        # Constraint 2: clean-cooking minimum
+        self._clean_min = total(self.CLEAN_TECHS, pulp.LpConstraintGE, "clean_min")
+        # Constraint 3: firewood cap
+        self._firewood_cap = total(
+            self.FIREWOOD_TECHS, pulp.LpConstraintLE, "firewood_cap"
+        )
+
+    def solve(self,
+              demand_GJ: float,
+              min_clean_share: float,
+              max_firewood_share: float,
+              tech_costs: Dict[str, float]) -> str:
+        """Solve for one demand level and return the PuLP status string.
+
+        Solved values are available from :attr:`variables` afterwards.
+        """
+        # Objective: minimise total cost
+        self.model.setObjective(
+            pulp.LpAffineExpression(
+                (self.variables[t], tech_costs[t]) for t in self.techs
+            )
+        )
+        self._demand.changeRHS(demand_GJ)
+        self._clean_min.changeRHS(min_clean_share * demand_GJ)
+        self._firewood_cap.changeRHS(max_firewood_share * demand_GJ)
+        self.model.solve(self._solver)
+        return pulp.LpStatus[self.model.status]
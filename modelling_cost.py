@@ -29,27 +29,65 @@ from __future__ import annotations
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
 from demand import (
     regions,
-    demand_by_region_year,
+    regional_table,
     urban_hh_by_region_year,
     rural_hh_by_region_year,
     URBAN_DEMAND_GJ_PER_HH,
     RURAL_DEMAND_GJ_PER_HH,
 )
-from technology_adoption_model import get_tech_mix_by_scenario
-from model import run_cost_fixed_mix, run_cost_minimise_cost, pulp
-from energy_demand_model import disaggregate_to_hourly
+from technology_adoption_model import get_tech_mix_matrix, load_household_df
+from model import (
+    CleanCookingLP,
+    pulp,
+    resolve_solver,
+)
+from energy_demand_model import disaggregate_to_hourly, uniform_year_index
 from config import CONFIG, load_config
-from paths import get_data_path
+from paths import get_data_path, write_excel
 
 DISCOUNT_RATE = 0.05
 BASE_YEAR = 2025
+DETAIL_COLUMNS = (
+    "Year", "Region", "Technology", "Share", "Energy_GJ", "Cost_USD", "Scenario"
+)
+SUMMARY_COLUMNS = (
+    "Scenario", "Year", "Region", "Total_Cost_USD", "Discounted_Cost_USD"
+)
+
+# Canonical technology order; per-technology arrays below are aligned with it
+TECHS = (
+    "firewood",
+    "charcoal",
+    "ics_firewood",
+    "ics_charcoal",
+    "biogas",
+    "ethanol",
+    "electricity",
+    "lpg",
+    "improved_biomass",
+)
+TECH_INDEX = {tech: i for i, tech in enumerate(TECHS)}
+# CAPEX per household (USD)
+_CAPEX_USD_PER_HH = np.array([0, 0, 25, 30, 450, 75, 100, 60, 40], dtype=np.float64)
+# Fuel cost (USD/GJ)
+_FUEL_USD_PER_GJ = np.array([2, 6, 2, 6, 1, 15, 12, 10, 4], dtype=np.float64)
+_LIFETIME_YEARS = 15
 
 
 def _compute_levelised_costs(urban_hh: float, rural_hh: float) -> Dict[str, float]:
@@ -73,48 +111,69 @@ def _compute_levelised_costs(urban_hh: float, rural_hh: float) -> Dict[str, floa
     dict
         Mapping of technology names to levelised cost per GJ (USD/GJ).
     """
-    capex = {
-        "firewood": 0,
-        "charcoal": 0,
-        "ics_firewood": 25,
-        "ics_charcoal": 30,
-        "biogas": 450,
-        "ethanol": 75,
-        "electricity": 100,
-        "lpg": 60,
-        "improved_biomass": 40,
-    }
-    fuel = {
-        "firewood": 2,
-        "charcoal": 6,
-        "ics_firewood": 2,
-        "ics_charcoal": 6,
-        "biogas": 1,
-        "ethanol": 15,
-        "electricity": 12,
-        "lpg": 10,
-        "improved_biomass": 4,
-    }
+    levelised = _levelised_cost_matrix(np.array([urban_hh]), np.array([rural_hh]))
+    return dict(zip(TECHS, levelised[0].tolist()))
+
 
-    levelised: Dict[str, float] = {}
-    years_lifetime = 15
+def _levelised_cost_matrix(urban_hh: np.ndarray, rural_hh: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`_compute_levelised_costs` over many regions.
 
+    Returns
+    -------
+    numpy.ndarray
+        Levelised cost per GJ (USD/GJ) with one row per region and one
+        column per technology in :data:`TECHS` order.
+    """
+    urban_hh = np.asarray(urban_hh, dtype=np.float64)
+    rural_hh = np.asarray(rural_hh, dtype=np.float64)
     total_hh = urban_hh + rural_hh
-    if total_hh > 0:
-        annual_energy_per_hh = (
-            (URBAN_DEMAND_GJ_PER_HH * urban_hh)
-            + (RURAL_DEMAND_GJ_PER_HH * rural_hh)
-        ) / total_hh
-    else:
-        annual_energy_per_hh = (URBAN_DEMAND_GJ_PER_HH + RURAL_DEMAND_GJ_PER_HH) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annual_energy_per_hh = np.where(
+            total_hh > 0,
+            (
+                (URBAN_DEMAND_GJ_PER_HH * urban_hh)
+                + (RURAL_DEMAND_GJ_PER_HH * rural_hh)
+            ) / total_hh,
+            (URBAN_DEMAND_GJ_PER_HH + RURAL_DEMAND_GJ_PER_HH) / 2,
+        )[:, None]
+        capex_per_gj = np.where(
+            annual_energy_per_hh > 0,
+            _CAPEX_USD_PER_HH / (annual_energy_per_hh * _LIFETIME_YEARS),
+            0.0,
+        )
+    return _FUEL_USD_PER_GJ + capex_per_gj
 
-    for tech in fuel:
-        capex_per_gj = 0.0
-        if capex.get(tech, 0) > 0 and annual_energy_per_hh > 0:
-            capex_per_gj = capex[tech] / (annual_energy_per_hh * years_lifetime)
-        levelised[tech] = fuel[tech] + capex_per_gj
 
-    return levelised
+def _regional_inputs(years: List[int]) -> pd.DataFrame:
+    """Flatten regional demand and household counts for ``years``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per ``(Year, Region)`` in :data:`demand.regions` order with
+        columns ``demand``, ``urban_hh`` and ``rural_hh``. Missing entries
+        default to zero.
+    """
+    n_regions = len(regions)
+    year_col = np.repeat(np.asarray(years, dtype=np.int64), n_regions)
+    region_col = np.tile(np.asarray(regions, dtype=object), len(years))
+    pos = regional_table.index.get_indexer(
+        pd.MultiIndex.from_arrays([region_col, year_col])
+    )
+    found = pos >= 0
+
+    def lookup(column: str) -> np.ndarray:
+        return np.where(found, regional_table[column].to_numpy()[pos], 0.0)
+
+    return pd.DataFrame(
+        {
+            "Year": year_col,
+            "Region": region_col,
+            "demand": lookup("demand_GJ"),
+            "urban_hh": lookup("urban_hh"),
+            "rural_hh": lookup("rural_hh"),
+        }
+    )
 
 
 @lru_cache()
@@ -126,9 +185,10 @@ def load_tech_specs() -> pd.DataFrame:
         raise FileNotFoundError(f"Tech specs file not found: {path}") from exc
 
 
+@lru_cache(maxsize=None)
 def _load_levelised_costs(
     scenario: str | None = None, year: int | None = None
-) -> Dict[str, float]:
+) -> Mapping[str, float]:
     """Load levelised costs per gigajoule for each technology.
 
     Parameters
@@ -140,9 +200,10 @@ def _load_levelised_costs(
 
     Returns
     -------
-    dict
+    Mapping
 
-        Mapping of technology names to levelised cost per GJ (USD/GJ).
+        Read-only mapping of technology names to levelised cost per GJ
+        (USD/GJ). Results are cached per ``(scenario, year)``.
 
     Notes
     -----
@@ -163,14 +224,198 @@ def _load_levelised_costs(
     except FileNotFoundError:
         total_urban = sum(urban_hh_by_region_year.get(year, {}).values())
         total_rural = sum(rural_hh_by_region_year.get(year, {}).values())
-        return _compute_levelised_costs(total_urban, total_rural)
+        return MappingProxyType(
+            _compute_levelised_costs(total_urban, total_rural)
+        )
 
+    keys, index = _tech_cost_index()
+    requested = {"Scenario": scenario, "Year": year}
+    if all(requested[key] is not None for key in keys):
+        return index.get(
+            tuple(requested[key] for key in keys), MappingProxyType({})
+        )
+
+    # Unfiltered lookups span several groups; filter the full table instead
     if scenario is not None and "Scenario" in df.columns:
         df = df[df["Scenario"] == scenario]
     if year is not None and "Year" in df.columns:
         df = df[df["Year"] == year]
-    return dict(zip(df["Technology"], df["Cost_per_GJ"]))
+    return MappingProxyType(dict(zip(df["Technology"], df["Cost_per_GJ"])))
+
+
+@lru_cache(maxsize=None)
+def _tech_cost_index() -> Tuple[Tuple[str, ...], Dict[tuple, Mapping[str, float]]]:
+    """Group the tech specs by whichever of ``Scenario``/``Year`` they contain.
+
+    Returns the key columns present and a mapping from their values to the
+    read-only technology cost mapping for that group.
+    """
+    df = load_tech_specs()
+    keys = tuple(col for col in ("Scenario", "Year") if col in df.columns)
+    groups = df.groupby(list(keys), sort=False) if keys else [((), df)]
+    index = {}
+    for key, group in groups:
+        key = key if isinstance(key, tuple) else (key,)
+        index[key] = MappingProxyType(
+            dict(zip(group["Technology"], group["Cost_per_GJ"]))
+        )
+    return keys, index
+
+
+def _cost_kernel(
+    energy: np.ndarray, unit_costs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Cost a ``(regions, techs)`` energy matrix.
+
+    Returns the per-technology costs and the total cost of each region.
+    """
+    cost = energy * unit_costs
+    return cost, cost.sum(axis=1)
+
+
+def _write_demand_timeseries(
+    scenario: str, year: int, series_by_region: Dict[str, pd.Series]
+) -> None:
+    """Write one scenario-year's regional demand series as a single file.
 
+    Files are laid out as a Hive-style partitioned dataset,
+    ``results/demand_timeseries/scenario=<s>/year=<y>/part-0.parquet``, so
+    ``pd.read_parquet("results/demand_timeseries")`` loads every run at
+    once. Without :mod:`pyarrow` the same table is written as CSV.
+    """
+    df = (
+        pd.concat(series_by_region, names=["region", "timestamp"])
+        .rename("demand_gj")
+        .reset_index()
+    )
+    out_dir = os.path.join(
+        "results", "demand_timeseries", f"scenario={scenario}", f"year={year}"
+    )
+    os.makedirs(out_dir, exist_ok=True)
+    if pq is None:
+        df.to_csv(os.path.join(out_dir, "part-0.csv"), index=False)
+    else:
+        df.to_parquet(os.path.join(out_dir, "part-0.parquet"), index=False)
+
+
+@lru_cache(maxsize=None)
+def _clean_cooking_lp(techs: Tuple[str, ...], solver: str) -> CleanCookingLP:
+    """Return the per-process LP for ``techs``, re-solved for each region."""
+    return CleanCookingLP(techs, solver)
+
+
+def _init_worker(optimise: bool, solver: str) -> None:
+    """Load the per-process state tasks share before the first task runs."""
+    if optimise:
+        _clean_cooking_lp(TECHS, solver)
+    else:
+        load_household_df()
+
+
+def _evaluate_scenario_year(
+    scenario: str,
+    year: int,
+    inputs: List[Tuple[str, float, float, float]],
+    unit_costs: np.ndarray,
+    optimise: bool,
+    min_clean_share: float,
+    max_firewood_share: float,
+    solver: str,
+    timeseries: str,
+) -> Tuple[Dict[str, list], Dict[str, list]]:
+    """Evaluate every region of one scenario and year.
+
+    Parameters
+    ----------
+    inputs : list of tuple
+        ``(region, annual_demand, urban_hh, rural_hh)`` per region.
+    unit_costs : numpy.ndarray
+        Levelised cost per GJ for each region in ``inputs`` (rows) and
+        technology in :data:`TECHS` order (columns).
+
+    The remaining parameters are as for :func:`run_all_scenarios`.
+
+    Returns
+    -------
+    dict, dict
+        Per-region detail column chunks keyed by :data:`DETAIL_COLUMNS`
+        and summary column chunks keyed by :data:`SUMMARY_COLUMNS`, with
+        undiscounted, unrounded totals.
+    """
+    # Energy is gathered per region in TECHS order, then costed in one pass
+    kept: List[int] = []
+    demands: List[float] = []
+    energy_rows: List[np.ndarray] = []
+    series_by_region: Dict[str, pd.Series] = {}
+    for i, (reg, annual_demand, urban_hh, rural_hh) in enumerate(inputs):
+        if annual_demand <= 0:
+            continue
+        if timeseries == "era5_4h":
+            try:
+                demand_series = disaggregate_to_hourly(
+                    annual_demand,
+                    get_data_path("era5/placeholder.nc"),
+                    "t2m",
+                    None,
+                    freq="4H",
+                )
+            except Exception:
+                idx = uniform_year_index("4H")
+                demand_series = pd.Series(annual_demand / len(idx), index=idx)
+            series_by_region[reg] = demand_series
+            demand = float(demand_series.sum())
+        else:
+            demand = annual_demand
+        if demand <= 0:
+            continue
+        if optimise:
+            tech_costs = dict(zip(TECHS, unit_costs[i].tolist()))
+            lp = _clean_cooking_lp(TECHS, solver)
+            status = lp.solve(demand, min_clean_share, max_firewood_share, tech_costs)
+            if status != "Optimal":
+                raise RuntimeError(f"No optimal solution for {reg} in {year}.")
+            energy_rows.append([var.varValue for var in lp.variables.values()])
+        kept.append(i)
+        demands.append(demand)
+    if series_by_region:
+        _write_demand_timeseries(scenario, year, series_by_region)
+
+    detail_parts: Dict[str, list] = {name: [] for name in DETAIL_COLUMNS}
+    summary_parts: Dict[str, list] = {name: [] for name in SUMMARY_COLUMNS[:-1]}
+    if not kept:
+        return detail_parts, summary_parts
+
+    kept_regions = [inputs[i][0] for i in kept]
+    demand_arr = np.array(demands, dtype=np.float64)
+    if optimise:
+        energy = np.array(energy_rows, dtype=np.float64)
+    else:
+        # Derive energy by technology for all districts using the adoption model
+        techs, mix = get_tech_mix_matrix(
+            scenario,
+            year,
+            kept_regions,
+            demand_arr,
+            np.array([inputs[i][2] for i in kept], dtype=np.float64),
+            np.array([inputs[i][3] for i in kept], dtype=np.float64),
+        )
+        energy = np.zeros((len(kept), len(TECHS)))
+        energy[:, [TECH_INDEX[t] for t in techs]] = mix
+    cost, totals = _cost_kernel(energy, unit_costs[kept])
+    n_regions, n_techs = energy.shape
+    detail_parts["Year"].append(np.full(n_regions * n_techs, year))
+    detail_parts["Region"].append(np.repeat(kept_regions, n_techs))
+    detail_parts["Technology"].append(np.tile(TECHS, n_regions))
+    detail_parts["Share"].append((energy / demand_arr[:, None]).ravel())
+    detail_parts["Energy_GJ"].append(energy.ravel())
+    detail_parts["Cost_USD"].append(cost.ravel())
+    detail_parts["Scenario"].append(np.full(n_regions * n_techs, scenario))
+
+    summary_parts["Scenario"].append(np.full(n_regions, scenario))
+    summary_parts["Year"].append(np.full(n_regions, year))
+    summary_parts["Region"].append(kept_regions)
+    summary_parts["Total_Cost_USD"].append(totals)
+    return detail_parts, summary_parts
 
 
 def run_all_scenarios(
@@ -182,6 +427,7 @@ def run_all_scenarios(
     config: Dict | str | None = None,
     min_clean_share: float | None = None,
     max_firewood_share: float | None = None,
+    n_jobs: int | None = 1,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
 
     """Execute the cost optimisation pipeline across all scenarios and years.
@@ -201,8 +447,8 @@ def run_all_scenarios(
         Otherwise use the fixed adoption shares.
     solver : str, optional
         Optimisation solver to use when ``optimise`` is ``True``.
-        Choices are ``"cbc"``, ``"glpk"`` and ``"gurobi"``. Defaults to the
-        ``solver`` entry in the configuration.
+        Choices are ``"highs"``, ``"cbc"``, ``"glpk"`` and ``"gurobi"``.
+        Defaults to the ``solver`` entry in the configuration.
     config : dict or str, optional
         Configuration dictionary or path to a YAML/JSON file. When omitted the
         built-in default configuration is used.
@@ -212,6 +458,10 @@ def run_all_scenarios(
     max_firewood_share : float, optional
         Override for the maximum traditional firewood share constraint. Falls
         back to ``constraints.max_firewood_share`` from the configuration.
+    n_jobs : int or None, optional
+        Number of worker processes used to evaluate the (scenario, year)
+        pairs. ``1`` (default) runs sequentially and ``None`` uses all CPUs.
+        Results are identical and in the same order either way.
 
     Returns
     -------
@@ -237,114 +487,130 @@ def run_all_scenarios(
         if max_firewood_share is not None
         else constraints.get("max_firewood_share", 1.0)
     )
-    solver = solver or cfg.get("solver", "cbc")
+    solver = solver or cfg.get("solver", "highs")
     os.makedirs("results", exist_ok=True)
 
     if optimise and pulp is None:
         raise RuntimeError(
             "PuLP is required for optimisation but is not installed. Install it via 'pip install pulp'."
         )
-    all_rows: List[pd.DataFrame] = []
-    summary_rows: List[Dict[str, float]] = []
-    for scenario in scenarios:
-        for year in years:
-            for reg in regions:
-                annual_demand = demand_by_region_year.get(year, {}).get(reg, 0.0)
-                if timeseries == "era5_4h":
-                    try:
-                        demand_series = disaggregate_to_hourly(
-                            annual_demand,
-                            get_data_path("era5/placeholder.nc"),
-                            "t2m",
-                            None,
-                            freq="4H",
-                        )
-                    except Exception:
-                        periods = int(pd.Timedelta("365D") / pd.Timedelta("4H"))
-                        idx = pd.date_range("2000-01-01", periods=periods, freq="4H")
-                        demand_series = pd.Series(annual_demand / periods, index=idx)
-                    out_ts = os.path.join(
-                        "results",
-                        "demand_timeseries",
-                        scenario,
-                        str(year),
-                        f"{reg}.csv",
-                    )
-                    os.makedirs(os.path.dirname(out_ts), exist_ok=True)
-                    demand_series.to_csv(out_ts, header=["demand_gj"])
-                    demand = float(demand_series.sum())
-                else:
-                    demand = annual_demand
-                urban_hh = urban_hh_by_region_year.get(year, {}).get(reg, 0.0)
-                rural_hh = rural_hh_by_region_year.get(year, {}).get(reg, 0.0)
-                if demand <= 0:
-                    continue
-                tech_costs = _compute_levelised_costs(urban_hh, rural_hh)
-                if optimise:
-                    df_reg, cost = run_cost_minimise_cost(
-                        year,
-                        reg,
-                        demand,
-                        min_clean_share,
-                        max_firewood_share,
-                        tech_costs,
-                        solver=solver,
-                    )
-                else:
-                    # Derive energy shares for the district using the adoption model
-                    _, energy_shares = get_tech_mix_by_scenario(
-                        scenario,
-                        year,
-                        reg,
-                        {},
-                        demand,
-                        urban_hh,
-                        rural_hh,
-                        {},
-                    )
-                    # Convert energy shares to fractional shares
-                    shares_fraction: Dict[str, float] = {}
-                    for tech, energy in energy_shares.items():
-                        shares_fraction[tech] = energy / demand if demand > 0 else 0.0
-                    # Run cost calculation using the fixed mix function
-                    df_reg, cost = run_cost_fixed_mix(
-                        year, reg, demand, shares_fraction, tech_costs
-                    )
-                df_reg["Scenario"] = scenario
-                all_rows.append(df_reg)
-
-                # Discounting: NPV-style
-                discount_factor = 1 / ((1 + DISCOUNT_RATE) ** (year - BASE_YEAR))
-                discounted_cost = cost * discount_factor
-                summary_rows.append(
-                    {
-                        "Scenario": scenario,
-                        "Year": year,
-                        "Region": reg,
-                        "Total_Cost_USD": round(cost, 2),
-                        "Discounted_Cost_USD": round(discounted_cost, 2),
-                    }
-                )
-    # Combine results into DataFrames
-    df_full = pd.concat(all_rows, ignore_index=True) if all_rows else pd.DataFrame()
-    df_summary = pd.DataFrame(summary_rows)
-    # Write outputs to Excel and per-scenario CSVs
+    if optimise:
+        # Record (and hand to workers) the solver that actually runs
+        solver = resolve_solver(solver)
+    # Discounting: NPV-style factor per year, shared by all regions
+    discount_factors = {
+        year: 1 / ((1 + DISCOUNT_RATE) ** (year - BASE_YEAR)) for year in years
+    }
+    # Regional inputs and levelised costs depend only on the year, so they
+    # are computed once and reused for every scenario
+    input_cols = ["Region", "demand", "urban_hh", "rural_hh"]
+    inputs_by_year = {}
+    unit_costs_by_year = {}
+    for year, group in _regional_inputs(years).groupby("Year", sort=False):
+        # Regions without demand contribute no rows, so skip their costs too
+        group = group[group["demand"] > 0]
+        inputs_by_year[year] = list(
+            group[input_cols].itertuples(index=False, name=None)
+        )
+        unit_costs_by_year[year] = _levelised_cost_matrix(
+            group["urban_hh"].to_numpy(), group["rural_hh"].to_numpy()
+        )
+    no_unit_costs = np.empty((0, len(TECHS)))
+    # Each (scenario, year) pair is an independent task covering all regions
+    tasks = [
+        (
+            scenario,
+            year,
+            inputs_by_year.get(year, []),
+            unit_costs_by_year.get(year, no_unit_costs),
+            optimise,
+            min_clean_share,
+            max_firewood_share,
+            solver,
+            timeseries,
+        )
+        for scenario in scenarios
+        for year in years
+    ]
     out_dir = os.path.join("results", "cost")
     os.makedirs(out_dir, exist_ok=True)
 
+    # Detail columns are collected as per-region chunks and assembled into
+    # a single DataFrame once all scenarios have been processed.
+    detail_parts: Dict[str, list] = {name: [] for name in DETAIL_COLUMNS}
+    summary_parts: Dict[str, list] = {name: [] for name in SUMMARY_COLUMNS[:-1]}
+    with ExitStack() as stack:
+        if n_jobs == 1 or len(tasks) < 2:
+            results = (_evaluate_scenario_year(*task) for task in tasks)
+        else:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    initializer=_init_worker,
+                    initargs=(optimise, solver),
+                )
+            )
+            results = executor.map(_evaluate_scenario_year, *zip(*tasks))
+        for task_parts, task_summary in results:
+            for name, parts in task_parts.items():
+                detail_parts[name].extend(parts)
+            for name, parts in task_summary.items():
+                summary_parts[name].extend(parts)
+    # Combine results into DataFrames
+    df_full = (
+        pd.DataFrame(
+            {name: np.concatenate(parts) for name, parts in detail_parts.items()}
+        )
+        if detail_parts["Year"]
+        else pd.DataFrame()
+    )
+    df_summary = (
+        pd.DataFrame(
+            {name: np.concatenate(parts) for name, parts in summary_parts.items()}
+        )
+        if summary_parts["Year"]
+        else pd.DataFrame()
+    )
+    # Scenario and Region repeat across many rows; categorical codes keep
+    # them compact and make the per-scenario split below hash integers
+    for df in (df_full, df_summary):
+        if not df.empty:
+            df["Scenario"] = pd.Categorical(df["Scenario"], categories=scenarios)
+            df["Region"] = pd.Categorical(df["Region"], categories=regions)
+    if not df_summary.empty:
+        # Discounting and rounding are applied column-wise once
+        totals = df_summary["Total_Cost_USD"].to_numpy()
+        factors = df_summary["Year"].map(discount_factors).to_numpy()
+        df_summary["Total_Cost_USD"] = totals.round(2)
+        df_summary["Discounted_Cost_USD"] = (totals * factors).round(2)
     output_path = os.path.join(out_dir, "ci_bioenergy_techpathways.xlsx")
-    with pd.ExcelWriter(output_path) as writer:
-        if not df_full.empty:
-            df_full.to_excel(writer, sheet_name="Details", index=False)
-        df_summary.to_excel(writer, sheet_name="Summary", index=False)
+    if df_full.empty and df_summary.empty:
+        # Nothing to write; drop outputs of an earlier run so the directory
+        # does not mix old results with this one
+        stale = [output_path] + [
+            os.path.join(out_dir, f"{scenario}_{kind}")
+            for scenario in scenarios
+            for kind in ("detail.csv", "summary.csv", "metadata.json")
+        ]
+        for path in stale:
+            if os.path.exists(path):
+                os.remove(path)
+        return df_full, df_summary
+    # Write outputs to Excel and per-scenario CSVs
+    sheets = {"Details": df_full} if not df_full.empty else {}
+    sheets["Summary"] = df_summary
+    write_excel(sheets, output_path)
 
     if not df_full.empty:
+        # Split each frame by scenario in a single pass
+        detail_groups = dict(tuple(df_full.groupby("Scenario", sort=False, observed=True)))
+        summary_groups = dict(tuple(df_summary.groupby("Scenario", sort=False, observed=True)))
         for scenario in scenarios:
-            df_full[df_full["Scenario"] == scenario].to_csv(
+            detail_groups.get(scenario, df_full.iloc[:0]).to_csv(
                 os.path.join(out_dir, f"{scenario}_detail.csv"),
                 index=False,
             )
-            df_summary[df_summary["Scenario"] == scenario].to_csv(
+            summary_groups.get(scenario, df_summary.iloc[:0]).to_csv(
                 os.path.join(out_dir, f"{scenario}_summary.csv"),
                 index=False,
             )
@@ -37,14 +37,30 @@ from typing import Dict, List
 import pandas as pd
 
 from data_input import get_parameters
-from population_urbanization_model import calculate_population_urbanization
+from population_urbanization_model import project_population_urbanization
 from energy_demand_model import project_household_energy_demand, export_demand_table
 from technology_adoption_model import (
     get_tech_mix_by_scenario,
-    generate_adoption_tables,
+    run_scenarios,
 )
 from ghg_emissions_model import calculate_emissions
 from config import CONFIG, load_config
+from paths import write_excel
+
+
+# Emission-model input keys for each technology; any other technology is
+# passed through as ``<tech>_GJ``
+_CATEGORY_MAP = {
+    "firewood": "traditional_firewood_GJ",
+    "charcoal": "traditional_charcoal_GJ",
+    "ics_firewood": "ics_firewood_GJ",
+    "ics_charcoal": "ics_charcoal_GJ",
+    "biogas": "biogas_GJ",
+    "ethanol": "ethanol_GJ",
+    "electricity": "electricity_GJ",
+    "lpg": "lpg_GJ",
+    "improved_biomass": "improved_biomass_GJ",
+}
 
 
 def _map_energy_categories(energy_by_tech: Dict[str, float]) -> Dict[str, float]:
@@ -64,32 +80,11 @@ def _map_energy_categories(energy_by_tech: Dict[str, float]) -> Dict[str, float]
         :func:`ghg_emissions_model.calculate_emissions`. Unknown
         technologies are passed through with a ``_GJ`` suffix.
     """
-    mapped: Dict[str, float] = {}
-    for tech, energy in energy_by_tech.items():
-        if energy == 0:
-            continue
-        if tech == "firewood":
-            mapped["traditional_firewood_GJ"] = mapped.get("traditional_firewood_GJ", 0) + energy
-        elif tech == "charcoal":
-            mapped["traditional_charcoal_GJ"] = mapped.get("traditional_charcoal_GJ", 0) + energy
-        elif tech == "ics_firewood":
-            mapped["ics_firewood_GJ"] = mapped.get("ics_firewood_GJ", 0) + energy
-        elif tech == "ics_charcoal":
-            mapped["ics_charcoal_GJ"] = mapped.get("ics_charcoal_GJ", 0) + energy
-        elif tech == "biogas":
-            mapped["biogas_GJ"] = mapped.get("biogas_GJ", 0) + energy
-        elif tech == "ethanol":
-            mapped["ethanol_GJ"] = mapped.get("ethanol_GJ", 0) + energy
-        elif tech == "electricity":
-            mapped["electricity_GJ"] = mapped.get("electricity_GJ", 0) + energy
-        elif tech == "lpg":
-            mapped["lpg_GJ"] = mapped.get("lpg_GJ", 0) + energy
-        elif tech == "improved_biomass":
-            mapped["improved_biomass_GJ"] = mapped.get("improved_biomass_GJ", 0) + energy
-        else:
-            # fall back to a generic category
-            mapped[f"{tech}_GJ"] = mapped.get(f"{tech}_GJ", 0) + energy
-    return mapped
+    return {
+        _CATEGORY_MAP.get(tech, f"{tech}_GJ"): energy
+        for tech, energy in energy_by_tech.items()
+        if energy != 0
+    }
 
 
 def run_all_scenarios(
@@ -97,6 +92,7 @@ def run_all_scenarios(
     years: List[int] | None = None,
     timeseries: str = "none",
     config: Dict | str | None = None,
+    n_jobs: int | None = 1,
 ) -> Dict[str, pd.DataFrame]:
     """Execute all stock‑flow scenarios and write results to Excel and CSV.
 
@@ -110,7 +106,10 @@ def run_all_scenarios(
     config : dict or str, optional
         Configuration dictionary or path to a YAML/JSON file. If omitted
         the built-in defaults are used.
-    
+    n_jobs : int or None, optional
+        Worker processes used to build the per-scenario adoption tables.
+        ``1`` (default) runs sequentially and ``None`` uses all CPUs.
+
     Returns
     -------
     dict
@@ -133,26 +132,36 @@ def run_all_scenarios(
     # Persist demand table for transparency
     export_demand_table(years)
 
+    # Demographics do not depend on the scenario: project all years at once
+    population = project_population_urbanization(
+        years,
+        params["population_total_2025"],
+        params["urbanization_rate_2025"],
+        params["population_growth_rate_annual"],
+        params["urbanization_growth_rate_annual"],
+        params["household_size_urban"],
+        params["household_size_rural"],
+    )
+    households = dict(
+        zip(
+            population.index.tolist(),
+            zip(
+                population["urban_households"].tolist(),
+                population["rural_households"].tolist(),
+            ),
+        )
+    )
+
+    # Persist adoption metrics for each scenario so they can be joined
+    # with spatial data or PyPSA networks.
+    run_scenarios(scenarios, years, n_jobs=n_jobs)
+
     for scenario in scenarios:
-        # Persist adoption metrics for the scenario so they can be joined
-        # with spatial data or PyPSA networks.
-        generate_adoption_tables(scenario, years)
         scenario_results: List[Dict[str, float]] = []
         # Initialize grid emission factor CO₂; update each year
         grid_ef_CO2 = params["grid_emission_factor_CO2_kg_kWh"]
         for year in years:
-            # Project demographics
-            pop = calculate_population_urbanization(
-                year,
-                params["population_total_2025"],
-                params["urbanization_rate_2025"],
-                params["population_growth_rate_annual"],
-                params["urbanization_growth_rate_annual"],
-                params["household_size_urban"],
-                params["household_size_rural"],
-            )
-            urban_hh = pop["urban_households"]
-            rural_hh = pop["rural_households"]
+            urban_hh, rural_hh = households[year]
             # Compute total energy demand based on households
             total_demand = project_household_energy_demand(urban_hh, rural_hh)
             # Derive technology mix (energy by tech) for a national aggregate
@@ -192,9 +201,8 @@ def run_all_scenarios(
 
     # Write results to Excel workbook and per-scenario CSVs
     output_path = "results/ci_bioenergy_scenarios.xlsx"
-    with pd.ExcelWriter(output_path) as writer:
-        for scenario, df in results_per_scenario.items():
-            df.to_excel(writer, sheet_name=scenario, index=False)
-            csv_path = os.path.join("results", f"stockflow_{scenario}.csv")
-            df.to_csv(csv_path, index=False)
+    write_excel(results_per_scenario, output_path)
+    for scenario, df in results_per_scenario.items():
+        csv_path = os.path.join("results", f"stockflow_{scenario}.csv")
+        df.to_csv(csv_path, index=False)
     return results_per_scenario
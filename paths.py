@@ -1,6 +1,44 @@
 """Utility helpers for locating data files."""
 
+from __future__ import annotations
+
+import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Mapping, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+try:
+    import xlsxwriter  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
+# Repository data directory, searched before ``./data``
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+# Parquet copies of parsed CSV inputs live here (ignored by git)
+CACHE_DIR = DATA_DIR / ".cache"
+
+
+@lru_cache(maxsize=None)
+def _repo_data_path(name: str) -> Path:
+    """Return ``name`` under the repository's ``data`` directory if it exists.
+
+    Raises :class:`FileNotFoundError` on a miss. Only hits are memoised,
+    so a file created later in the run is still picked up.
+    """
+
+    repo_data = DATA_DIR / name
+    if not repo_data.exists():
+        raise FileNotFoundError(repo_data)
+    return repo_data
 
 
 def get_data_path(name: str) -> Path:
@@ -12,8 +50,73 @@ def get_data_path(name: str) -> Path:
     while still resolving data files correctly.
     """
 
-    repo_data = Path(__file__).resolve().parent / "data" / name
-    if repo_data.exists():
-        return repo_data
-    return Path.cwd() / "data" / name
+    try:
+        return _repo_data_path(name)
+    except FileNotFoundError:
+        return Path.cwd() / "data" / name
+
+
+def read_csv_cached(
+    path: str | Path, usecols: Sequence[str] | None = None
+) -> pd.DataFrame:
+    """Read ``path`` via a Parquet cache in :data:`CACHE_DIR`.
+
+    The CSV is parsed once and stored as Parquet under a name derived from
+    the CSV's location, modification time and size, so any change to the
+    source yields a fresh cache entry. Without :mod:`pyarrow` the CSV is
+    read directly.
+
+    ``usecols`` restricts the result to the named columns. The cache always
+    holds the whole file, so callers selecting different columns share one
+    entry, and only the requested columns are read back from it.
+    """
+
+    path = Path(path).resolve()
+    columns = list(usecols) if usecols is not None else None
+    if pyarrow is None:
+        return pd.read_csv(path, usecols=columns)
+
+    stat = path.stat()
+    prefix = f"{path.stem}-{hashlib.md5(str(path).encode()).hexdigest()[:8]}"
+    cache_path = CACHE_DIR / f"{prefix}-{stat.st_mtime_ns}-{stat.st_size}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path, columns=columns)
+
+    df = pd.read_csv(path)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob(f"{prefix}-*.parquet"):
+            stale.unlink()
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # read-only checkout: fall back to parsing the CSV each time
+    return df[columns] if columns is not None else df
+
+
+def write_excel(sheets: Mapping[str, pd.DataFrame], path: str | Path) -> None:
+    """Write each DataFrame in ``sheets`` (without its index) to ``path``.
+
+    With :mod:`xlsxwriter` installed the workbook is streamed row by row in
+    ``constant_memory`` mode, so only one row is held in memory at a time.
+    pandas' own writer emits cells column by column, which that mode does
+    not support. Falls back to :class:`pandas.ExcelWriter` otherwise.
+    """
+
+    if xlsxwriter is None:
+        with pd.ExcelWriter(path) as writer:
+            for name, df in sheets.items():
+                df.to_excel(writer, sheet_name=name, index=False)
+        return
 
+    with xlsxwriter.Workbook(str(path), {"constant_memory": True}) as workbook:
+        bold = workbook.add_format({"bold": True})
+        for name, df in sheets.items():
+            sheet = workbook.add_worksheet(name)
+            sheet.write_row(0, 0, [str(col) for col in df.columns], bold)
+            # Missing values become blank cells, as with pandas
+            values = df.astype(object).where(df.notna(), None)
+            for row, record in enumerate(values.itertuples(index=False, name=None), 1):
+                sheet.write_row(row, 0, record)
@@ -9,7 +9,10 @@ numbers are derived from region-specific household sizes.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
 
 
 def calculate_population_urbanization(
@@ -62,4 +65,47 @@ def calculate_population_urbanization(
         "rural_population": rural_pop,
         "urban_households": urban_hh,
         "rural_households": rural_hh,
-    }
\ No newline at end of file
+    }
+
+
+def project_population_urbanization(
+    years: Iterable[int],
+    initial_pop: float,
+    initial_urban_rate: float,
+    pop_growth_rate: float,
+    urban_growth_rate: float,
+    household_size_urban: float,
+    household_size_rural: float,
+) -> pd.DataFrame:
+    """Vectorised :func:`calculate_population_urbanization` over many years.
+
+    Parameters
+    ----------
+    years : iterable of int
+        Calendar years for which to perform the projection.
+
+    The remaining parameters are as for
+    :func:`calculate_population_urbanization`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per year (the index) with the same columns as the keys
+        returned by :func:`calculate_population_urbanization`.
+    """
+    years = np.asarray(list(years), dtype=np.int64)
+    delta = years - 2025
+    total_pop = initial_pop * (1 + pop_growth_rate) ** delta.astype(np.float64)
+    urban_rate = np.minimum(initial_urban_rate + urban_growth_rate * delta, 0.9)
+    urban_pop = total_pop * urban_rate
+    rural_pop = total_pop - urban_pop
+    return pd.DataFrame(
+        {
+            "total_population": total_pop,
+            "urban_population": urban_pop,
+            "rural_population": rural_pop,
+            "urban_households": urban_pop / household_size_urban,
+            "rural_households": rural_pop / household_size_rural,
+        },
+        index=pd.Index(years, name="year"),
+    )
@@ -45,9 +45,18 @@ import pandas as pd
 
 @lru_cache()
 def _load_bus_metadata() -> pd.DataFrame:
-    """Read bus metadata generated by :mod:`spatial_config`."""
+    """Read bus metadata generated by :mod:`spatial_config`.
+
+    The Parquet copy is preferred when it is at least as new as the CSV.
+    """
 
     path = os.path.join("results", "buses.csv")
+    parquet_path = os.path.join("results", "buses.parquet")
+    try:
+        if os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+            return pd.read_parquet(parquet_path)
+    except (OSError, ImportError):
+        pass
     try:
         return pd.read_csv(path)
     except FileNotFoundError as exc:
@@ -136,7 +145,7 @@ def write_pypsa_loads(df_results: pd.DataFrame, output_dir: str) -> None:
     if loads.empty:
         return
 
-    loads = loads.groupby("Region")["Energy_GJ"].sum().reset_index()
+    loads = loads.groupby("Region", observed=True)["Energy_GJ"].sum().reset_index()
     loads["name"] = loads["Region"].apply(lambda r: f"load_{r}")
     loads["bus"] = loads["Region"]
     loads["p_set"] = loads["Energy_GJ"] * _GJ_TO_MWH / _HOURS_PER_YEAR
@@ -186,7 +195,7 @@ def write_pypsa_generators(
         subset = df_results[df_results["Technology"].isin(techs)]
         if subset.empty:
             continue
-        grouped = subset.groupby(["Region", "Technology"]) ["Energy_GJ"].sum().reset_index()
+        grouped = subset.groupby(["Region", "Technology"], observed=True)["Energy_GJ"].sum().reset_index()
         for region in grouped["Region"].unique():
             reg_df = grouped[grouped["Region"] == region]
             total_energy = reg_df["Energy_GJ"].sum()
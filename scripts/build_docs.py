@@ -4,7 +4,19 @@ from __future__ import annotations
 
 import json
 import os
-from glob import glob
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _load_metadata(path: str) -> dict:
+    """Return the parsed JSON in ``path``."""
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def gather_metadata(results_dir: str = "results") -> list[tuple[str, str, dict]]:
@@ -16,14 +28,30 @@ def gather_metadata(results_dir: str = "results") -> list[tuple[str, str, dict]]
         stage_dir = os.path.join(results_dir, stage)
         if not os.path.isdir(stage_dir):
             continue
-        for meta_path in glob(os.path.join(stage_dir, "*_metadata.json")):
-            with open(meta_path) as f:
-                meta = json.load(f)
-            data_file = os.path.basename(meta_path).replace("_metadata.json", "")
-            records.append((stage, data_file, meta))
+        with os.scandir(stage_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith("_metadata.json"):
+                    continue
+                data_file = entry.name.replace("_metadata.json", "")
+                records.append((stage, data_file, _load_metadata(entry.path)))
     return records
 
 
+def _format_record(stage: str, data_file: str, meta: dict) -> list[str]:
+    """Return the Markdown lines describing one metadata record."""
+
+    lines = [
+        f"## {stage.replace('_', ' ').title()} – {data_file}",
+        f"- Timestamp: {meta.get('timestamp', 'n/a')}",
+    ]
+    params = meta.get("parameters", {})
+    if params:
+        lines.append("- Parameters:")
+        lines.extend(f"  - {key}: {value}" for key, value in params.items())
+    lines.append("")
+    return lines
+
+
 def build_report(output_path: str = os.path.join("docs", "report.md")) -> None:
     """Generate a Markdown report from collected metadata."""
 
@@ -31,14 +59,7 @@ def build_report(output_path: str = os.path.join("docs", "report.md")) -> None:
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     lines = ["# Methodology and Data Lineage", ""]
     for stage, data_file, meta in meta_records:
-        lines.append(f"## {stage.replace('_', ' ').title()} – {data_file}")
-        lines.append(f"- Timestamp: {meta.get('timestamp', 'n/a')}")
-        params = meta.get("parameters", {})
-        if params:
-            lines.append("- Parameters:")
-            for key, value in params.items():
-                lines.append(f"  - {key}: {value}")
-        lines.append("")
+        lines.extend(_format_record(stage, data_file, meta))
     with open(output_path, "w") as fh:
         fh.write("\n".join(lines))
     print(f"Report written to {output_path}")
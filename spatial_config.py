@@ -8,18 +8,35 @@ This module now delegates demographic and demand calculations to the
 from __future__ import annotations
 
 import os
+from importlib.util import find_spec
+
 import pandas as pd
 
+import demand as _demand
 from demand import (
-    regions,
     URBAN_DEMAND_GJ_PER_HH,
     RURAL_DEMAND_GJ_PER_HH,
-    demand_by_region_year,
-    urban_hh_by_region_year,
-    rural_hh_by_region_year,
+    load_demographics,
+)
+
+# Data-backed tables are forwarded lazily from :mod:`demand` so importing
+# this module does not read the projection CSV
+_LAZY_ATTRS = frozenset(
+    {
+        "regions",
+        "demand_by_region_year",
+        "urban_hh_by_region_year",
+        "rural_hh_by_region_year",
+    }
 )
 
 
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        return getattr(_demand, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def generate_buses_csv(
     output_path: str = os.path.join("results", "buses.csv")
 ) -> pd.DataFrame:
@@ -28,7 +45,9 @@ def generate_buses_csv(
     The table contains one row per region and year with the number of
     urban and rural households. It is stored at ``results/buses.csv`` by
     default so that other modules (e.g. PyPSA export utilities) can join
-    against it.
+    against it. With :mod:`pyarrow` installed a Parquet copy is written
+    next to the CSV for faster loading; an ``output_path`` ending in
+    ``.parquet`` writes only the Parquet file.
 
     Parameters
     ----------
@@ -42,20 +61,23 @@ def generate_buses_csv(
         Data frame containing the bus metadata.
     """
 
-    rows = []
-    for year, regions_dict in urban_hh_by_region_year.items():
-        for region, urban_hh in regions_dict.items():
-            rows.append(
-                {
-                    "region": region,
-                    "year": year,
-                    "urban_hh": urban_hh,
-                    "rural_hh": rural_hh_by_region_year[year][region],
-                }
-            )
-    buses_df = pd.DataFrame(rows).sort_values(["region", "year"])
+    buses_df = (
+        load_demographics()[["Urban_Households", "Rural_Households"]]
+        .rename(
+            columns={"Urban_Households": "urban_hh", "Rural_Households": "rural_hh"}
+        )
+        .rename_axis(["region", "year"])
+        .reset_index()
+        .astype({"region": str})
+        .sort_values(["region", "year"])
+    )
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    buses_df.to_csv(output_path, index=False)
+    root, ext = os.path.splitext(output_path)
+    if ext != ".parquet":
+        buses_df.to_csv(output_path, index=False)
+    # Only probe for pyarrow here; pandas imports it when writing Parquet
+    if ext == ".parquet" or find_spec("pyarrow") is not None:
+        buses_df.to_parquet(root + ".parquet", index=False)
     return buses_df
 
 
@@ -1,44 +1,29 @@
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from functools import lru_cache
+from itertools import repeat
 
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from demand.demographics import load_demographics
 
 
-@lru_cache()
-def load_household_df() -> pd.DataFrame:
-    """Read household projections from disk.
+# The adoption model shares the demographics loader (and its cached frame)
+# with :mod:`demand`, so the projections are parsed once per process
+load_household_df = load_demographics
 
-    Returns
-    -------
-    pandas.DataFrame
-        Data indexed by ``District`` and ``Year`` with household counts.
-    """
 
-    path = os.path.join("data", "District-level_Household_Projections.csv")
-    try:
-        df = pd.read_csv(path)
-    except FileNotFoundError as exc:
-        raise FileNotFoundError(
-            f"Household projection file not found: {path}"
-        ) from exc
-    df.columns = df.columns.str.strip()
-    df.set_index(["District", "Year"], inplace=True)
-    return df
-
-from paths import get_data_path
-
-# Load household projections once
-household_df = pd.read_csv(
-    get_data_path("District-level_Household_Projections.csv")
-)
-household_df.columns = household_df.columns.str.strip()
-household_df.set_index(["District", "Year"], inplace=True)
+def __getattr__(name: str):
+    # ``household_df`` is loaded on first access rather than at import
+    if name == "household_df":
+        return load_household_df()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Base shares can be scenario-dependent later
@@ -117,6 +102,56 @@ base_shares = {
     }
 }
 
+# Shares as one contiguous ``(scenario, urban/rural, technology)`` array so
+# mixes are computed with whole-array arithmetic
+_TECHS = tuple(base_shares["bau"]["urban"])
+_SCENARIO_INDEX = {scenario: i for i, scenario in enumerate(base_shares)}
+_SHARES = np.array(
+    [
+        [[shares[area][tech] for tech in _TECHS] for area in ("urban", "rural")]
+        for shares in base_shares.values()
+    ]
+)
+
+
+@lru_cache(maxsize=1)
+def _household_lookup() -> dict:
+    """Return ``{(district, year): (urban, rural)}`` from the projections."""
+
+    hh_df = load_household_df()
+    counts = zip(
+        hh_df["Urban_Households"].tolist(), hh_df["Rural_Households"].tolist()
+    )
+    return dict(zip(hh_df.index, counts))
+
+
+def _scenario_shares(scenario: str) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """Return ``(technologies, urban_shares, rural_shares)`` for ``scenario``."""
+
+    idx = _SCENARIO_INDEX.get(scenario)
+    if idx is None:
+        # normalise scenario name: lower-case and replace spaces with underscores
+        idx = _SCENARIO_INDEX.get(scenario.lower().replace(" ", "_"))
+        if idx is None:
+            raise ValueError(f"Scenario '{scenario}' not recognised")
+    urban_share, rural_share = _SHARES[idx]
+    return _TECHS, urban_share, rural_share
+
+
+def _tech_mix_raw(scenario: str, urban_count, rural_count, demand):
+    """Return ``(technologies, shares, energy)`` for ``scenario``, unrounded.
+
+    Household counts and demand may be scalars or ``(n, 1)`` arrays, in
+    which case ``shares`` and ``energy`` have one row per entry.
+    """
+
+    techs, urban_share, rural_share = _scenario_shares(scenario)
+    shares = (urban_share * urban_count + rural_share * rural_count) / (
+        urban_count + rural_count + 1e-6
+    )
+    return techs, shares, demand * shares
+
+
 def get_tech_mix_by_scenario(
     scenario: str,
     year: int,
@@ -158,42 +193,104 @@ def get_tech_mix_by_scenario(
         ``energy_by_tech`` is a simple mapping used by legacy code paths.
     """
 
-    # normalise scenario name: lower-case and replace spaces with underscores
-    scenario_key = scenario.lower().replace(" ", "_")
-    if scenario_key not in base_shares:
-        raise ValueError(f"Scenario '{scenario}' not recognised")
+    techs, share, energy = _cached_mix(
+        scenario, district, year, demand, urban_hh, rural_hh
+    )
+    energy_by_tech = dict(zip(techs, energy.tolist()))
 
-    hh_df = load_household_df()
-    try:
-        urban_count = hh_df.loc[(district, year), "Urban_Households"]
-        rural_count = hh_df.loc[(district, year), "Rural_Households"]
-    except KeyError:
+    # The cached arrays are read-only and shared; callers get their own copy
+    df = pd.DataFrame(
+        {
+            "region": district,
+            "year": year,
+            "technology": list(techs),
+            "share": share.copy(),
+            "energy_GJ": energy.copy(),
+        }
+    ).set_index(["region", "year"])
+    return df, energy_by_tech
+
+
+@lru_cache(maxsize=4096)
+def _cached_mix(
+    scenario: str,
+    district: str,
+    year: int,
+    demand: float,
+    urban_hh: float,
+    rural_hh: float,
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """Return rounded ``(technologies, shares, energy)`` for one district.
+
+    Memoised because ``params`` and ``prev_shares`` do not affect the mix;
+    the arrays are read-only as they are shared between callers.
+    """
+
+    counts = _household_lookup().get((district, year))
+    if counts is not None:
+        urban_count, rural_count = counts
+    else:
         urban_count = urban_hh
         rural_count = rural_hh
 
-    rows = []
-    energy_by_tech: dict = {}
-
-    for tech in base_shares[scenario_key]["urban"]:
-        urban_share = base_shares[scenario_key]["urban"][tech]
-        rural_share = base_shares[scenario_key]["rural"][tech]
-        weighted_share = (urban_share * urban_count + rural_share * rural_count) / (
-            urban_count + rural_count + 1e-6
-        )
-        energy = demand * weighted_share
-        energy_by_tech[tech] = round(energy, 4)
-        rows.append(
-            {
-                "region": district,
-                "year": year,
-                "technology": tech,
-                "share": round(weighted_share, 4),
-                "energy_GJ": round(energy, 4),
-            }
-        )
-
-    df = pd.DataFrame(rows).set_index(["region", "year"])
-    return df, energy_by_tech
+    techs, share, energy = _tech_mix_raw(scenario, urban_count, rural_count, demand)
+    share = share.round(4)
+    energy = energy.round(4)
+    share.flags.writeable = False
+    energy.flags.writeable = False
+    return techs, share, energy
+
+
+def get_tech_mix_matrix(
+    scenario: str,
+    year: int,
+    districts: Sequence[str],
+    demand: np.ndarray,
+    urban_hh: np.ndarray,
+    rural_hh: np.ndarray,
+) -> Tuple[List[str], np.ndarray]:
+    """Vectorised :func:`get_tech_mix_by_scenario` for many districts.
+
+    Parameters
+    ----------
+    scenario : str
+        Scenario name.
+    year : int
+        Evaluation year.
+    districts : sequence of str
+        Regions for which to compute the mix.
+    demand, urban_hh, rural_hh : numpy.ndarray
+        Per-district demand (GJ) and fallback household counts, aligned
+        with ``districts``.
+
+    Returns
+    -------
+    tuple
+        ``(technologies, energy)`` where ``energy`` is a
+        ``(len(districts), len(technologies))`` array of energy by
+        technology in GJ, rounded to four decimals.
+    """
+
+    # Household counts come from the projection table where available
+    hh_df = load_household_df()
+    pos = hh_df.index.get_indexer(
+        pd.MultiIndex.from_arrays([list(districts), [year] * len(districts)])
+    )
+    found = pos >= 0
+    urban_count = np.where(
+        found, hh_df["Urban_Households"].to_numpy()[pos], urban_hh
+    )[:, None]
+    rural_count = np.where(
+        found, hh_df["Rural_Households"].to_numpy()[pos], rural_hh
+    )[:, None]
+
+    techs, _, energy = _tech_mix_raw(
+        scenario,
+        urban_count,
+        rural_count,
+        np.asarray(demand, dtype=np.float64)[:, None],
+    )
+    return list(techs), energy.round(4)
 
 
 def generate_adoption_tables(
@@ -220,23 +317,34 @@ def generate_adoption_tables(
 
     hh_df = load_household_df()
     districts = districts or sorted(hh_df.index.get_level_values(0).unique())
-    records: List[pd.DataFrame] = []
     params = {}
-    for year in years:
-        for district in districts:
-            try:
-                hh = hh_df.loc[(district, year)]
-                urban_hh = hh["Urban_Households"]
-                rural_hh = hh["Rural_Households"]
-            except KeyError:
-                continue
-            demand = (urban_hh * 6.5) + (rural_hh * 5.5)
-            df, _ = get_tech_mix_by_scenario(
-                scenario, year, district, params, demand, urban_hh, rural_hh, {}
-            )
-            records.append(df)
 
-    result = pd.concat(records)
+    # All (year, district) pairs at once; pairs missing from the table are
+    # dropped
+    pair_years = np.repeat(np.asarray(years, dtype=np.int64), len(districts))
+    pair_districts = np.tile(np.asarray(districts, dtype=object), len(years))
+    pos = hh_df.index.get_indexer(
+        pd.MultiIndex.from_arrays([pair_districts, pair_years])
+    )
+    found = pos >= 0
+    pos = pos[found]
+    urban_hh = hh_df["Urban_Households"].to_numpy()[pos][:, None]
+    rural_hh = hh_df["Rural_Households"].to_numpy()[pos][:, None]
+
+    demand = (urban_hh * 6.5) + (rural_hh * 5.5)
+    techs, weighted_share, energy = _tech_mix_raw(
+        scenario, urban_hh, rural_hh, demand
+    )
+    n_techs = len(techs)
+    result = pd.DataFrame(
+        {
+            "region": np.repeat(pair_districts[found], n_techs),
+            "year": np.repeat(pair_years[found], n_techs),
+            "technology": np.tile(np.asarray(techs, dtype=object), len(pos)),
+            "share": weighted_share.round(4).ravel(),
+            "energy_GJ": energy.round(4).ravel(),
+        }
+    ).set_index(["region", "year"])
     out_dir = os.path.join("results", "adoption")
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, f"{scenario}.csv")
@@ -252,3 +360,43 @@ def generate_adoption_tables(
         json.dump(meta, f)
     return result
 
+
+def run_scenarios(
+    scenarios: Sequence[str],
+    years: List[int],
+    districts: List[str] | None = None,
+    n_jobs: int | None = 1,
+) -> Dict[str, pd.DataFrame]:
+    """Run :func:`generate_adoption_tables` for several scenarios.
+
+    Parameters
+    ----------
+    scenarios : sequence of str
+        Scenario names to evaluate.
+    years, districts
+        As for :func:`generate_adoption_tables`.
+    n_jobs : int or None, optional
+        Number of worker processes. ``1`` (default) runs sequentially and
+        ``None`` uses all CPUs. Scenarios share no mutable state, so results
+        are identical either way.
+
+    Returns
+    -------
+    dict
+        Mapping of scenario names to their adoption tables.
+    """
+
+    scenarios = list(scenarios)
+    if n_jobs == 1 or len(scenarios) < 2:
+        tables = [generate_adoption_tables(s, years, districts) for s in scenarios]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            tables = list(
+                executor.map(
+                    generate_adoption_tables,
+                    scenarios,
+                    repeat(years),
+                    repeat(districts),
+                )
+            )
+    return dict(zip(scenarios, tables))
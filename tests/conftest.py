@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Make the top-level modules importable from every test module
+sys.path.insert(0, str(REPO_ROOT))
+
+HOUSEHOLD_CSV = REPO_ROOT / "data" / "District-level_Household_Projections.csv"
+
+
+@pytest.fixture(scope="session")
+def household_projections():
+    """The household projection CSV, parsed once per test session."""
+    return pd.read_csv(HOUSEHOLD_CSV)
+
+
+@pytest.fixture(scope="session")
+def glpk_available():
+    """Whether the GLPK binary is usable, probed once per test session."""
+    try:
+        import pulp
+    except ImportError:
+        return False
+    return bool(pulp.GLPK_CMD().available())
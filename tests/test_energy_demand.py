@@ -1,25 +1,19 @@
 import importlib
 import sys
-from pathlib import Path
 import types
 
 import pandas as pd
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-
-def _prepare_modules(monkeypatch):
+def _prepare_modules(monkeypatch, household_projections):
     """Patch data loading and import target modules."""
-    data_file = (
-        Path(__file__).resolve().parent.parent
-        / "data"
-        / "District-level_Household_Projections.csv"
-    )
     real_read_csv = pd.read_csv
 
     def mock_read_csv(path, *args, **kwargs):
         if str(path).endswith("District-level_Household_Projections.csv"):
-            return real_read_csv(data_file, *args, **kwargs)
+            usecols = kwargs.get("usecols")
+            df = household_projections
+            return (df[list(usecols)] if usecols is not None else df).copy()
         return real_read_csv(path, *args, **kwargs)
 
     monkeypatch.setattr(pd, "read_csv", mock_read_csv)
@@ -37,8 +31,10 @@ def _prepare_modules(monkeypatch):
     return demand_module, energy_demand_model
 
 
-def test_cooking_demand_increases(monkeypatch):
-    demand_module, energy_demand_model = _prepare_modules(monkeypatch)
+def test_cooking_demand_increases(monkeypatch, household_projections):
+    demand_module, energy_demand_model = _prepare_modules(
+        monkeypatch, household_projections
+    )
 
     base_year = 2030
     later_years = [2040, 2050]
@@ -1,13 +1,10 @@
 import importlib
-import pathlib
 import sys
 import types
 
 import pandas as pd
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 
 def _import_edm(monkeypatch, series):
     demand = types.ModuleType("demand")
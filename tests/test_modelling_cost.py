@@ -0,0 +1,162 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import model
+import modelling_cost as mc
+import technology_adoption_model as tam
+from demand import (
+    demand_by_region_year,
+    regions,
+    rural_hh_by_region_year,
+    urban_hh_by_region_year,
+)
+
+_SCENARIOS = ["bau", "clean_push"]
+_YEARS = [2030, 2050]
+_MIN_CLEAN_SHARE = 0.4
+_MAX_FIREWOOD_SHARE = 0.3
+
+
+@lru_cache(maxsize=None)
+def _scalar_results(optimise):
+    """Per-region results from the scalar ``model.run_cost_*`` functions."""
+    frames, totals = [], []
+    for scenario in _SCENARIOS:
+        for year in _YEARS:
+            for reg in regions:
+                demand = demand_by_region_year.get(year, {}).get(reg, 0.0)
+                if demand <= 0:
+                    continue
+                urban_hh = urban_hh_by_region_year.get(year, {}).get(reg, 0.0)
+                rural_hh = rural_hh_by_region_year.get(year, {}).get(reg, 0.0)
+                tech_costs = mc._compute_levelised_costs(urban_hh, rural_hh)
+                if optimise:
+                    df, cost = model.run_cost_minimise_cost(
+                        year, reg, demand, _MIN_CLEAN_SHARE,
+                        _MAX_FIREWOOD_SHARE, tech_costs, solver="cbc",
+                    )
+                else:
+                    _, energy = tam.get_tech_mix_by_scenario(
+                        scenario, year, reg, {}, demand, urban_hh, rural_hh, {}
+                    )
+                    shares = {t: gj / demand for t, gj in energy.items()}
+                    df, cost = model.run_cost_fixed_mix(
+                        year, reg, demand, shares, tech_costs
+                    )
+                df["Scenario"] = scenario
+                frames.append(df)
+                totals.append(cost)
+    return pd.concat(frames, ignore_index=True), np.array(totals)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("optimise", [False, True])
+def test_run_all_scenarios_matches_scalar_model(
+    optimise, n_jobs, tmp_path, monkeypatch
+):
+    if optimise and model.pulp is None:
+        pytest.skip("PuLP not installed")
+    monkeypatch.chdir(tmp_path)
+    expected_full, expected_totals = _scalar_results(optimise)
+
+    df_full, df_summary = mc.run_all_scenarios(
+        scenarios=_SCENARIOS,
+        years=_YEARS,
+        optimise=optimise,
+        solver="cbc",
+        min_clean_share=_MIN_CLEAN_SHARE,
+        max_firewood_share=_MAX_FIREWOOD_SHARE,
+        n_jobs=n_jobs,
+    )
+
+    df_full = df_full.astype({"Region": str, "Scenario": str})
+    pd.testing.assert_frame_equal(df_full, expected_full, check_dtype=False)
+    np.testing.assert_array_equal(
+        df_summary["Total_Cost_USD"].to_numpy(), expected_totals.round(2)
+    )
+    assert (tmp_path / "results" / "cost" / "bau_detail.csv").exists()
+
+
+def test_get_tech_mix_matrix_matches_per_district_mix():
+    year = 2030
+    # The last district is missing from the projection table, so its
+    # fallback household counts are used
+    districts = [*regions[:5], "Nowhere"]
+    demand = np.linspace(100.0, 600.0, len(districts))
+    urban_hh = np.full(len(districts), 10.0)
+    rural_hh = np.full(len(districts), 5.0)
+
+    techs, energy = tam.get_tech_mix_matrix(
+        "clean_push", year, districts, demand, urban_hh, rural_hh
+    )
+
+    for row, district in enumerate(districts):
+        _, expected = tam.get_tech_mix_by_scenario(
+            "clean_push", year, district, {}, demand[row],
+            urban_hh[row], rural_hh[row], {},
+        )
+        assert techs == list(expected)
+        np.testing.assert_allclose(energy[row], list(expected.values()))
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_run_scenarios_matches_per_district_mix(n_jobs, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    hh_df = tam.load_household_df()
+    districts = sorted(hh_df.index.get_level_values(0).unique())[:5]
+
+    tables = tam.run_scenarios(_SCENARIOS, _YEARS, districts, n_jobs=n_jobs)
+
+    assert list(tables) == _SCENARIOS
+    for scenario, table in tables.items():
+        expected = []
+        for year in _YEARS:
+            for district in districts:
+                urban_hh, rural_hh = hh_df.loc[
+                    (district, year), ["Urban_Households", "Rural_Households"]
+                ]
+                df, _ = tam.get_tech_mix_by_scenario(
+                    scenario, year, district, {},
+                    urban_hh * 6.5 + rural_hh * 5.5, urban_hh, rural_hh, {},
+                )
+                expected.append(df)
+        pd.testing.assert_frame_equal(
+            table, pd.concat(expected), check_dtype=False, check_index_type=False
+        )
+        assert (tmp_path / "results" / "adoption" / f"{scenario}.csv").exists()
+
+
+def test_run_all_scenarios_empty_result_removes_stale_outputs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out_dir = tmp_path / "results" / "cost"
+    out_dir.mkdir(parents=True)
+    stale = [
+        out_dir / "ci_bioenergy_techpathways.xlsx",
+        out_dir / "bau_detail.csv",
+        out_dir / "bau_summary.csv",
+        out_dir / "bau_metadata.json",
+    ]
+    for path in stale:
+        path.write_text("stale")
+
+    # No projections exist for this year, so every region has zero demand
+    df_full, df_summary = mc.run_all_scenarios(scenarios=["bau"], years=[1900])
+
+    assert df_full.empty and df_summary.empty
+    assert not any(path.exists() for path in stale)
+
+
+def test_get_tech_mix_by_scenario_returns_writable_copies():
+    args = ("bau", 2030, regions[0], {}, 100.0, 10.0, 5.0, {})
+    df, energy = tam.get_tech_mix_by_scenario(*args)
+    df["share"].to_numpy()[0] = -1.0
+    df.iloc[0, df.columns.get_loc("energy_GJ")] = -1.0
+    energy["firewood"] = -1.0
+
+    df_again, energy_again = tam.get_tech_mix_by_scenario(*args)
+    assert (df_again["share"] >= 0).all()
+    assert (df_again["energy_GJ"] >= 0).all()
+    assert energy_again["firewood"] >= 0
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import paths
+
+
+@pytest.mark.skipif(paths.xlsxwriter is None, reason="xlsxwriter not installed")
+def test_write_excel_streams_all_cells(tmp_path):
+    details = pd.DataFrame(
+        {
+            "Year": [2030, 2030, 2040],
+            "Region": ["A", "B", "A"],
+            "Cost_USD": [1.5, np.nan, 3.0],
+        }
+    )
+    summary = pd.DataFrame({"Scenario": ["bau"], "Total": [4.5]})
+    out = tmp_path / "out.xlsx"
+
+    paths.write_excel({"Details": details, "Summary": summary}, out)
+
+    sheets = pd.read_excel(out, sheet_name=None)
+    assert list(sheets) == ["Details", "Summary"]
+    pd.testing.assert_frame_equal(sheets["Details"], details)
+    pd.testing.assert_frame_equal(sheets["Summary"], summary)
+
+
+def test_get_data_path_falls_back_to_current_directory(tmp_path, monkeypatch):
+    first, second = tmp_path / "one", tmp_path / "two"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert paths.get_data_path("missing.csv") == first / "data" / "missing.csv"
+    monkeypatch.chdir(second)
+    assert paths.get_data_path("missing.csv") == second / "data" / "missing.csv"
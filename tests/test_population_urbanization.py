@@ -0,0 +1,20 @@
+import pytest
+
+from population_urbanization_model import (
+    calculate_population_urbanization,
+    project_population_urbanization,
+)
+
+
+def test_project_population_urbanization_matches_scalar():
+    args = (30_000_000, 0.52, 0.025, 0.02, 4.5, 5.5)
+    years = [2025, 2030, 2040, 2050, 2060]
+    df = project_population_urbanization(years, *args)
+    assert df.index.tolist() == years
+    for year in years:
+        expected = calculate_population_urbanization(year, *args)
+        assert df.loc[year].to_dict() == pytest.approx(expected)
+    # Urbanisation is capped at 90 %
+    assert df.loc[2060, "urban_population"] == pytest.approx(
+        0.9 * df.loc[2060, "total_population"]
+    )
@@ -1,9 +1,5 @@
-import os
-import sys
-
 import pytest
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from energy_demand_model import project_population
 
 
@@ -1,15 +1,13 @@
-import pathlib
-import sys
+from types import MappingProxyType
+
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 import model
 
 pulp = model.pulp
 
-@pytest.mark.skipif(pulp is None, reason="PuLP not installed")
-def test_run_cost_minimise_cost_cbc():
-    tech_costs = {
+_TECH_COSTS = MappingProxyType(
+    {
         "firewood": 2,
         "charcoal": 3,
         "biogas": 1,
@@ -18,30 +16,70 @@ def test_run_cost_minimise_cost_cbc():
         "lpg": 6,
         "improved_biomass": 2,
     }
+)
+
+@pytest.mark.skipif(pulp is None, reason="PuLP not installed")
+@pytest.mark.parametrize("solver", ["highs", "cbc", "glpk"])
+def test_run_cost_minimise_cost(solver, glpk_available):
+    if solver == "glpk" and not glpk_available:
+        pytest.skip("GLPK not installed")
     df, cost = model.run_cost_minimise_cost(
-        2025, "reg", 10, 0, 1, tech_costs, solver="cbc"
+        2025, "reg", 10, 0, 1, _TECH_COSTS, solver=solver
     )
     assert pytest.approx(df["Energy_GJ"].sum()) == 10
     assert cost >= 0
 
 @pytest.mark.skipif(pulp is None, reason="PuLP not installed")
-def test_run_cost_minimise_cost_glpk():
-    tech_costs = {
-        "firewood": 2,
-        "charcoal": 3,
-        "biogas": 1,
-        "ethanol": 4,
-        "electricity": 5,
-        "lpg": 6,
-        "improved_biomass": 2,
-    }
-    if pulp.GLPK_CMD().available():
-        df, _ = model.run_cost_minimise_cost(
-            2025, "reg", 10, 0, 1, tech_costs, solver="glpk"
+def test_run_cost_minimise_cost_unavailable_solver_raises(glpk_available):
+    if glpk_available:
+        pytest.skip("GLPK is installed")
+    with pytest.raises(RuntimeError):
+        model.run_cost_minimise_cost(
+            2025, "reg", 10, 0, 1, _TECH_COSTS, solver="glpk"
         )
-        assert pytest.approx(df["Energy_GJ"].sum()) == 10
-    else:
-        with pytest.raises(RuntimeError):
-            model.run_cost_minimise_cost(
-                2025, "reg", 10, 0, 1, tech_costs, solver="glpk"
-            )
+
+@pytest.mark.skipif(pulp is None, reason="PuLP not installed")
+def test_run_cost_minimise_cost_highs_matches_cbc():
+    # Falls back to CBC when HiGHS is not installed
+    df_highs, cost_highs = model.run_cost_minimise_cost(
+        2025, "reg", 10, 0.4, 0.3, _TECH_COSTS, solver="highs"
+    )
+    _, cost_cbc = model.run_cost_minimise_cost(
+        2025, "reg", 10, 0.4, 0.3, _TECH_COSTS, solver="cbc"
+    )
+    assert pytest.approx(df_highs["Energy_GJ"].sum()) == 10
+    assert pytest.approx(cost_highs) == cost_cbc
+
+@pytest.mark.skipif(pulp is None, reason="PuLP not installed")
+def test_clean_cooking_lp_resolve_matches_fresh_model():
+    lp = model.CleanCookingLP(_TECH_COSTS, solver="cbc")
+    assert lp.solve(10, 0, 1, _TECH_COSTS) == "Optimal"
+    cheaper_firewood = dict(_TECH_COSTS, firewood=0.5)
+    assert lp.solve(20, 0.4, 0.3, cheaper_firewood) == "Optimal"
+    resolved = {t: v.varValue for t, v in lp.variables.items()}
+    _, expected_cost = model.run_cost_minimise_cost(
+        2025, "reg", 20, 0.4, 0.3, cheaper_firewood, solver="cbc"
+    )
+    assert pytest.approx(sum(resolved.values())) == 20
+    assert pytest.approx(resolved["firewood"]) == 6
+    assert pytest.approx(
+        sum(gj * cheaper_firewood[t] for t, gj in resolved.items())
+    ) == expected_cost
+
+@pytest.mark.skipif(pulp is None, reason="PuLP not installed")
+def test_resolve_solver_logs_fallback(monkeypatch, caplog):
+    class _Unavailable:
+        def __init__(self, **kwargs):
+            pass
+
+        def available(self):
+            return False
+
+    monkeypatch.setattr(model, "_highs_solver", _Unavailable)
+    model._available_solver.cache_clear()
+    try:
+        with caplog.at_level("WARNING", logger="model"):
+            assert model.resolve_solver("highs") == "cbc"
+    finally:
+        model._available_solver.cache_clear()
+    assert "falling back to 'cbc'" in caplog.text
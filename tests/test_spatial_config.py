@@ -1,44 +1,48 @@
-import os
-import subprocess
-import sys
-from pathlib import Path
+import importlib
+import runpy
 
 import pandas as pd
+import pytest
 
+import paths
 
-def test_generate_buses_csv_only_when_run_as_script(tmp_path):
+
+@pytest.fixture
+def cwd_data(tmp_path, monkeypatch):
+    """A small projection CSV under ``./data``, with the repository data hidden."""
     data_dir = tmp_path / "data"
     data_dir.mkdir()
-    csv_path = data_dir / "District-level_Household_Projections.csv"
-    df = pd.DataFrame(
+    pd.DataFrame(
         {
             "District": ["A"],
             "Year": [2020],
             "Urban_Households": [1],
             "Rural_Households": [1],
         }
-    )
-    df.to_csv(csv_path, index=False)
-
-    repo_root = Path(__file__).resolve().parents[1]
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(repo_root)
-
-    results_file = tmp_path / "results" / "buses.csv"
-
-    subprocess.run(
-        [sys.executable, "-c", "import spatial_config"],
-        cwd=tmp_path,
-        env=env,
-        check=True,
-    )
+    ).to_csv(data_dir / "District-level_Household_Projections.csv", index=False)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(paths, "DATA_DIR", tmp_path / "missing")
+    monkeypatch.setattr(paths, "CACHE_DIR", tmp_path / "cache")
+    # Other test modules may have re-imported demographics; use the live one
+    load_demographics = importlib.import_module(
+        "demand.demographics"
+    ).load_demographics
+    paths._repo_data_path.cache_clear()
+    load_demographics.cache_clear()
+    yield tmp_path
+    paths._repo_data_path.cache_clear()
+    load_demographics.cache_clear()
+
+
+def test_generate_buses_csv_only_when_run_as_script(cwd_data):
+    results_file = cwd_data / "results" / "buses.csv"
+
+    runpy.run_module("spatial_config")
     assert not results_file.exists()
 
-    subprocess.run(
-        [sys.executable, "-m", "spatial_config"],
-        cwd=tmp_path,
-        env=env,
-        check=True,
-    )
-    assert results_file.exists()
-
+    runpy.run_module("spatial_config", run_name="__main__")
+    buses = pd.read_csv(results_file)
+    assert buses.to_dict("records") == [
+        {"region": "A", "year": 2020, "urban_hh": 1, "rural_hh": 1}
+    ]